@@ -29,6 +29,20 @@ except Exception:
     spm = None  # type: ignore
 
 
+CJK_RE = re.compile(r"[\u4e00-\u9fff]")
+_CJK_GAP_RE = re.compile(r"(?<=[\u4e00-\u9fff])\s+(?=[\u4e00-\u9fff])")
+
+
+def _intra_threads() -> int:
+    raw = os.environ.get("FLASHTRANS_INTRA_THREADS", "").strip()
+    if raw:
+        try:
+            return max(1, int(raw))
+        except ValueError:
+            pass
+    return max(1, (os.cpu_count() or 4) // 2)
+
+
 @dataclass(frozen=True)
 class EngineStatus:
     ocr_ready: bool
@@ -49,6 +63,7 @@ class CoreEngine:
         nllb_model_dir: str | os.PathLike | None = None,
         nllb_src_lang_en: str = "eng_Latn",
         nllb_tgt_lang_zh: str = "zho_Hans",
+        compute_type: str = "auto",
     ) -> None:
         self._mt_backend = str(mt_backend or "opus").strip().lower()
         self._nllb_model_dir = Path(nllb_model_dir) if nllb_model_dir else None
@@ -56,6 +71,7 @@ class CoreEngine:
         self._nllb_tgt_lang_zh = str(nllb_tgt_lang_zh or "zho_Hans").strip()
         self._model_dir_en2zh = Path(model_dir_en2zh)
         self._model_dir_zh2en = Path(model_dir_zh2en)
+        self._compute_type = str(compute_type or "auto").strip().lower() or "auto"
 
         self._ocr: Any = None
         self._ocr_ready = False
@@ -74,6 +90,8 @@ class CoreEngine:
         self._last_ocr_error = ""
         self._last_en2zh_error = ""
         self._last_zh2en_error = ""
+        self._warmed = False
+        self._vmap_translators: set[int] = set()
 
         self._init_all()
 
@@ -88,7 +106,7 @@ class CoreEngine:
             zh2en_error=self._last_zh2en_error,
         )
 
-    def translate_en2zh(self, text: str) -> str:
+    def translate_en2zh(self, text: str, beam_size: int = 7) -> str:
         text = self._normalize_english_input(text)
         if not text:
             return ""
@@ -100,13 +118,17 @@ class CoreEngine:
             return ""
         try:
             if self._mt_backend == "nllb":
-                return self._translate_nllb(text, src_lang=self._nllb_src_lang_en, tgt_lang=self._nllb_tgt_lang_zh)
-            return self._translate_with_chunking(text, self.translator_en2zh, self._sp_en2zh_src, self._sp_en2zh_tgt)
+                return self._translate_nllb(
+                    text, src_lang=self._nllb_src_lang_en, tgt_lang=self._nllb_tgt_lang_zh, beam_size=beam_size
+                )
+            return self._translate_with_chunking(
+                text, self.translator_en2zh, self._sp_en2zh_src, self._sp_en2zh_tgt, beam_size=beam_size
+            )
         except Exception as e:
             self._set_error(f"EN->ZH translation failed: {e}", kind="en2zh")
             return ""
 
-    def translate_zh2en(self, text: str) -> str:
+    def translate_zh2en(self, text: str, beam_size: int = 7) -> str:
         text = (text or "").strip()
         if not text:
             return ""
@@ -118,12 +140,33 @@ class CoreEngine:
             return ""
         try:
             if self._mt_backend == "nllb":
-                return self._translate_nllb(text, src_lang=self._nllb_tgt_lang_zh, tgt_lang=self._nllb_src_lang_en)
-            return self._translate_with_chunking(text, self.translator_zh2en, self._sp_zh2en_src, self._sp_zh2en_tgt)
+                return self._translate_nllb(
+                    text, src_lang=self._nllb_tgt_lang_zh, tgt_lang=self._nllb_src_lang_en, beam_size=beam_size
+                )
+            return self._translate_with_chunking(
+                text, self.translator_zh2en, self._sp_zh2en_src, self._sp_zh2en_tgt, beam_size=beam_size
+            )
         except Exception as e:
             self._set_error(f"ZH->EN translation failed: {e}", kind="zh2en")
             return ""
 
+    def warmup(self) -> None:
+        if self._warmed:
+            return
+        self._warmed = True
+        pairs = []
+        if self._en2zh_ready and self.translator_en2zh is not None and self._sp_en2zh_src is not None:
+            pairs.append((self.translator_en2zh, self._sp_en2zh_src, "Hello"))
+        if self._zh2en_ready and self.translator_zh2en is not None and self._sp_zh2en_src is not None:
+            if self.translator_zh2en is not self.translator_en2zh:
+                pairs.append((self.translator_zh2en, self._sp_zh2en_src, "你好"))
+        for translator, sp_src, text in pairs:
+            try:
+                tokens = [*sp_src.encode_as_pieces(text), "</s>"]
+                translator.translate_batch([tokens], max_batch_size=1, beam_size=1, max_decoding_length=8)
+            except Exception:
+                pass
+
     def ocr_image(self, image_data: Any) -> str:
         if not self._ocr_ready or self._ocr is None:
             self._set_error(self._last_ocr_error or "OCR not ready", kind="ocr")
@@ -147,7 +190,7 @@ class CoreEngine:
             return "", msg
         if self._mt_backend == "none":
             return source_text, ""
-        is_zh = bool(re.search(r"[\u4e00-\u9fff]", source_text))
+        is_zh = bool(CJK_RE.search(source_text))
         if is_zh:
             translated = self.translate_zh2en(source_text)
             if not translated:
@@ -177,7 +220,7 @@ class CoreEngine:
         text = re.sub(r"\n{2}", "\n", text)
         text = re.sub(r"[ ]{2,}", " ", text).strip()
 
-        if re.search(r"[\u4e00-\u9fff]", text):
+        if CJK_RE.search(text):
             text = text.replace("义件", "文件")
             text = text.replace("工试", "重试")
 
@@ -288,14 +331,16 @@ class CoreEngine:
             raise ModuleNotFoundError("ctranslate2 not installed")
         if spm is None:
             raise ModuleNotFoundError("sentencepiece not installed")
-        if not model_dir.exists():
-            raise FileNotFoundError(f"Model directory not found: {model_dir.resolve()}")
+        try:
+            with os.scandir(model_dir) as it:
+                present = {e.name for e in it}
+        except (FileNotFoundError, NotADirectoryError):
+            raise FileNotFoundError(f"Model directory not found: {model_dir.resolve()}") from None
 
         def _pick_first_existing(names: list[str]) -> Path | None:
             for name in names:
-                p = model_dir / name
-                if p.exists():
-                    return p
+                if name in present:
+                    return model_dir / name
             return None
 
         src_model = _pick_first_existing(["sentencepiece.model", "source.spm", "sentencepiece.bpe.model"])
@@ -311,19 +356,52 @@ class CoreEngine:
             tgt_model = src_model
 
         sp_src = spm.SentencePieceProcessor(model_proto=src_model.read_bytes())
-        sp_tgt = None
-        if tgt_model.exists():
+        if tgt_model == src_model:
+            sp_tgt = sp_src
+        else:
             sp_tgt = spm.SentencePieceProcessor(model_proto=tgt_model.read_bytes())
 
-        translator = ctranslate2.Translator(
-            str(model_dir),
-            device="cpu",
-            compute_type="int8",
-            inter_threads=1,
-            intra_threads=max(1, (os.cpu_count() or 4) // 2),
-        )
+        device, compute_type = self._resolve_device()
+        try:
+            translator = ctranslate2.Translator(
+                str(model_dir),
+                device=device,
+                compute_type=compute_type,
+                inter_threads=1,
+                intra_threads=_intra_threads(),
+            )
+        except Exception:
+            if device != "cuda":
+                raise
+            # A GPU can be present without the CUDA runtime libraries; run on CPU instead.
+            translator = ctranslate2.Translator(
+                str(model_dir),
+                device="cpu",
+                compute_type="int8" if self._compute_type == "auto" else self._compute_type,
+                inter_threads=1,
+                intra_threads=_intra_threads(),
+            )
+        if "vmap.txt" in present:
+            self._vmap_translators.add(id(translator))
         return translator, sp_src, sp_tgt
 
+    def _resolve_device(self) -> tuple[str, str]:
+        cuda = False
+        try:
+            cuda = int(ctranslate2.get_cuda_device_count()) > 0
+        except Exception:
+            cuda = False
+        compute_type = self._compute_type
+        if compute_type == "auto":
+            return ("cuda", "int8_float16") if cuda else ("cpu", "int8")
+        if cuda:
+            try:
+                if compute_type in ctranslate2.get_supported_compute_types("cuda"):
+                    return "cuda", compute_type
+            except Exception:
+                pass
+        return "cpu", compute_type
+
     def _translate_with_chunking(
         self,
         text: str,
@@ -332,6 +410,7 @@ class CoreEngine:
         sp_tgt: Any,
         target_prefix_token: str | None = None,
         source_prefix_tokens: list[str] | None = None,
+        beam_size: int = 7,
     ) -> str:
         text = (text or "").strip()
         if not text:
@@ -361,11 +440,14 @@ class CoreEngine:
 
         if token_lists:
             kwargs: dict[str, Any] = {
-                "beam_size": 7,
+                "beam_size": max(1, int(beam_size)),
+                "max_batch_size": 16,
                 "repetition_penalty": 1.5,
                 "max_decoding_length": 1024,
                 "return_scores": False,
             }
+            if id(translator) in self._vmap_translators:
+                kwargs["use_vmap"] = True
             try:
                 kwargs["no_repeat_ngram_size"] = 5
             except Exception:
@@ -407,7 +489,7 @@ class CoreEngine:
                 cur_head = part[0] if part else ""
                 if prev_tail not in "，。！？；：、,.!?;:":
                     if not (
-                        re.match(r"[\u4e00-\u9fff]", prev_tail or "") and re.match(r"[\u4e00-\u9fff]", cur_head or "")
+                        CJK_RE.match(prev_tail or "") and CJK_RE.match(cur_head or "")
                     ):
                         merged_parts.append(" ")
             merged_parts.append(part)
@@ -418,7 +500,7 @@ class CoreEngine:
         merged = re.sub(r"\n[ ]+", "\n", merged)
         return merged.strip()
 
-    def _translate_nllb(self, text: str, src_lang: str, tgt_lang: str) -> str:
+    def _translate_nllb(self, text: str, src_lang: str, tgt_lang: str, beam_size: int = 7) -> str:
         src_lang = str(src_lang or "").strip()
         tgt_lang = str(tgt_lang or "").strip()
         if not src_lang or not tgt_lang:
@@ -430,6 +512,7 @@ class CoreEngine:
             self._sp_en2zh_tgt,
             target_prefix_token=tgt_lang,
             source_prefix_tokens=[src_lang],
+            beam_size=beam_size,
         )
 
     def _chunk_text(self, text: str) -> list[str]:
@@ -446,7 +529,7 @@ class CoreEngine:
                 seg = seg.strip()
                 if not seg:
                     continue
-                has_zh = bool(re.search(r"[\u4e00-\u9fff]", seg))
+                has_zh = bool(CJK_RE.search(seg))
                 comma_count = seg.count("，") + seg.count(",")
                 if has_zh and (len(seg) > 80 or (comma_count >= 2 and len(seg) > 40)):
                     parts.extend([s for s in re.split(r"(?<=[，,])", seg) if s.strip()])
@@ -503,7 +586,7 @@ class CoreEngine:
         text = text.replace("⁇", "")
         text = text.replace("??", "")
         text = re.sub(r"[ \t]{2,}", " ", text)
-        has_zh = bool(re.search(r"[\u4e00-\u9fff]", text))
+        has_zh = bool(CJK_RE.search(text))
         if has_zh:
             text = text.replace(",", "，").replace("?", "？").replace("!", "！").replace(";", "；").replace(":", "：")
             text = re.sub(r"(?<!\.)\.(?!\.)", "。", text)
@@ -524,11 +607,11 @@ class CoreEngine:
             }
             for wrong, correct in term_map.items():
                 text = text.replace(wrong, correct)
-        text = re.sub(r"(?<=[\u4e00-\u9fff])\s+(?=[\u4e00-\u9fff])", "", text)
+        text = _CJK_GAP_RE.sub("", text)
         text = re.sub(r"\s+([，。！？；：、])", r"\1", text)
         text = re.sub(r"([，。！？；：、])\s+", r"\1", text)
         text = re.sub(r"\s+([,.;:!?])", r"\1", text)
-        text = re.sub(r"(?<=[\u4e00-\u9fff])\s+(?=[\u4e00-\u9fff])", "", text)
+        text = _CJK_GAP_RE.sub("", text)
         text = (
             text.replace("， ", "，")
             .replace("。 ", "。")
@@ -568,9 +651,9 @@ class CoreEngine:
             h = qimage.height()
 
         bytes_per_line = int(qimage.bytesPerLine())
-        ptr = qimage.bits()
-        buf = ptr.tobytes() if hasattr(ptr, "tobytes") else bytes(ptr)
-        rgba = np.frombuffer(buf, dtype=np.uint8).reshape((h, bytes_per_line // 4, 4))
+        ptr = qimage.constBits()
+        buf = ptr if isinstance(ptr, memoryview) else (ptr.tobytes() if hasattr(ptr, "tobytes") else bytes(ptr))
+        rgba = np.frombuffer(buf, dtype=np.uint8, count=h * bytes_per_line).reshape((h, bytes_per_line // 4, 4))
         rgba = rgba[:, :w, :]
         bgr = rgba[:, :, :3][:, :, ::-1].copy()
         return bgr
@@ -1,19 +1,24 @@
 from __future__ import annotations
 
 import ctypes
+import functools
+import itertools
 import os
 import re
 import sys
+import threading
 import time
+from collections import OrderedDict, namedtuple
 from ctypes import wintypes
 from pathlib import Path
+from typing import Callable
 
-from PySide6.QtCore import QAbstractNativeEventFilter, QObject, QThread, Qt, QTimer, Signal, Slot, QRect
-from PySide6.QtGui import QColor, QCursor, QGuiApplication, QIcon, QImage, QPainter, QPixmap
+from PySide6.QtCore import QAbstractNativeEventFilter, QObject, QThread, Qt, QTimer, Signal, Slot, QPoint, QRect
+from PySide6.QtGui import QClipboard, QColor, QCursor, QGuiApplication, QIcon, QImage, QPainter, QPixmap
 from PySide6.QtWidgets import QApplication, QMenu, QMessageBox, QSystemTrayIcon, QStyle
 
 from chat_window import ChatWindow
-from core_engine import CoreEngine
+from core_engine import CJK_RE, CoreEngine
 from llm_api import LlmConfig, chat_completions
 from local_qwen import LocalQwen, LocalQwenError, QwenLocalConfig, guess_target_lang
 from main_window import DashboardWindow
@@ -21,7 +26,15 @@ from settings_store import SettingsStore
 from snipping_tool import SnippingOverlay
 from ui_popups import FloatingPopup, ScreenshotResultOverlay
 
+try:
+    import numpy as np  # type: ignore
+except Exception:
+    np = None  # type: ignore
+
 WM_HOTKEY = 0x0312
+WM_INPUTLANGCHANGE = 0x0051
+WM_CLIPBOARDUPDATE = 0x031D
+HWND_MESSAGE = -3
 MOD_ALT = 0x0001
 MOD_CONTROL = 0x0002
 MOD_SHIFT = 0x0004
@@ -33,6 +46,7 @@ WM_LBUTTONDOWN = 0x0201
 WM_RBUTTONDOWN = 0x0204
 WM_MBUTTONDOWN = 0x0207
 WM_XBUTTONDOWN = 0x020B
+WM_MOUSEMOVE = 0x0200
 
 VK_F1 = 0x70
 VK_F2 = 0x71
@@ -54,6 +68,53 @@ KEYEVENTF_SCANCODE = 0x0008
 KEYEVENTF_UNICODE = 0x0004
 MAPVK_VK_TO_VSC = 0
 
+_MODE_NONE = 0
+_MODE_F1 = 1
+_MODE_F1_LLM = 2
+_MODE_F2 = 3
+_MODE_F2_LLM = 4
+_MODE_F2_COMMIT = 5
+_MODE_F2_COMMIT_LLM = 6
+_MODE_F3 = 7
+_MODE_F3_LLM = 8
+_MODE_DASH = 9
+_MODE_DASH_LLM = 10
+_MODE_CHAT = 11
+
+_PENDING_SLOTS = 256
+_PENDING_MASK = _PENDING_SLOTS - 1
+
+_XLAT_CACHE_MAX = 512
+
+# Hotkey paths translate short snippets and want latency; the dashboard keeps
+# the engine's wider beam.
+_BEAM_INTERACTIVE = 1
+_BEAM_DASHBOARD = 7
+
+PendingF1 = namedtuple("PendingF1", "anchor text is_zh")
+PendingF1Llm = namedtuple("PendingF1Llm", "anchor text")
+PendingF2Commit = namedtuple("PendingF2Commit", "hwnd text is_zh")
+PendingF2CommitLlm = namedtuple("PendingF2CommitLlm", "hwnd text")
+PendingF3Llm = namedtuple("PendingF3Llm", "rect text")
+
+
+def _has_cjk(s: str) -> bool:
+    if len(s) > 4096:
+        return _scan_cjk(s)
+    return _scan_cjk_cached(s)
+
+
+def _scan_cjk(s: str) -> bool:
+    if len(s) < 64:
+        return any("\u4e00" <= c <= "\u9fff" for c in s)
+    if np is not None:
+        a = np.frombuffer(s.encode("utf-32-le"), dtype=np.uint32)
+        return bool(((a - 0x4E00) < 0x5200).any())
+    return bool(CJK_RE.search(s))
+
+
+_scan_cjk_cached = functools.lru_cache(maxsize=2048)(_scan_cjk)
+
 ULONG_PTR = getattr(wintypes, "ULONG_PTR", ctypes.c_size_t)
 LRESULT = getattr(wintypes, "LRESULT", ctypes.c_ssize_t)
 
@@ -173,6 +234,16 @@ MapVirtualKeyW = user32.MapVirtualKeyW
 MapVirtualKeyW.argtypes = [wintypes.UINT, wintypes.UINT]
 MapVirtualKeyW.restype = wintypes.UINT
 
+_SCAN: dict[int, int] = {}
+
+
+def refresh_scancodes() -> None:
+    for vk in (VK_CONTROL, VK_C, VK_V, VK_A, VK_INSERT):
+        _SCAN[vk] = int(MapVirtualKeyW(vk, MAPVK_VK_TO_VSC))
+
+
+refresh_scancodes()
+
 GetForegroundWindow = user32.GetForegroundWindow
 GetForegroundWindow.argtypes = []
 GetForegroundWindow.restype = wintypes.HWND
@@ -209,7 +280,37 @@ IsClipboardFormatAvailable = user32.IsClipboardFormatAvailable
 IsClipboardFormatAvailable.argtypes = [wintypes.UINT]
 IsClipboardFormatAvailable.restype = wintypes.BOOL
 
+AddClipboardFormatListener = user32.AddClipboardFormatListener
+AddClipboardFormatListener.argtypes = [wintypes.HWND]
+AddClipboardFormatListener.restype = wintypes.BOOL
+
+RemoveClipboardFormatListener = user32.RemoveClipboardFormatListener
+RemoveClipboardFormatListener.argtypes = [wintypes.HWND]
+RemoveClipboardFormatListener.restype = wintypes.BOOL
+
+CreateWindowExW = user32.CreateWindowExW
+CreateWindowExW.argtypes = [
+    wintypes.DWORD,
+    wintypes.LPCWSTR,
+    wintypes.LPCWSTR,
+    wintypes.DWORD,
+    ctypes.c_int,
+    ctypes.c_int,
+    ctypes.c_int,
+    ctypes.c_int,
+    wintypes.HWND,
+    wintypes.HMENU,
+    wintypes.HINSTANCE,
+    wintypes.LPVOID,
+]
+CreateWindowExW.restype = wintypes.HWND
+
+DestroyWindow = user32.DestroyWindow
+DestroyWindow.argtypes = [wintypes.HWND]
+DestroyWindow.restype = wintypes.BOOL
+
 CF_UNICODETEXT = 13
+_CLIPBOARD_MAX_CHARS = 1 << 24
 
 GetWindowRect = user32.GetWindowRect
 GetWindowRect.argtypes = [wintypes.HWND, ctypes.c_void_p]
@@ -227,6 +328,10 @@ GlobalSize = kernel32.GlobalSize
 GlobalSize.argtypes = [wintypes.HGLOBAL]
 GlobalSize.restype = ctypes.c_size_t
 
+_wcsnlen = ctypes.cdll.msvcrt.wcsnlen
+_wcsnlen.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+_wcsnlen.restype = ctypes.c_size_t
+
 SetWindowsHookExW = user32.SetWindowsHookExW
 SetWindowsHookExW.argtypes = [ctypes.c_int, ctypes.c_void_p, wintypes.HINSTANCE, wintypes.DWORD]
 SetWindowsHookExW.restype = wintypes.HHOOK
@@ -247,6 +352,9 @@ GetCurrentThreadId = kernel32.GetCurrentThreadId
 GetCurrentThreadId.argtypes = []
 GetCurrentThreadId.restype = wintypes.DWORD
 
+_HMOD = GetModuleHandleW(None)
+_MAIN_TID = int(GetCurrentThreadId())
+
 WH_KEYBOARD_LL = 13
 WH_MOUSE_LL = 14
 
@@ -293,54 +401,101 @@ class KEYBDINPUT(ctypes.Structure):
     ]
 
 
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ULONG_PTR),
+    ]
+
+
+class HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [
+        ("uMsg", wintypes.DWORD),
+        ("wParamL", wintypes.WORD),
+        ("wParamH", wintypes.WORD),
+    ]
+
+
 class INPUT(ctypes.Structure):
+    # SendInput rejects the call unless cbSize is the full union size, and
+    # MOUSEINPUT is the largest member.
     class _U(ctypes.Union):
-        _fields_ = [("ki", KEYBDINPUT)]
+        _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT), ("hi", HARDWAREINPUT)]
 
     _anonymous_ = ("u",)
     _fields_ = [("type", wintypes.DWORD), ("u", _U)]
 
 
-def _send_ctrl_c() -> None:
-    _send_ctrl_combo_scan(VK_C)
-    _send_ctrl_combo_vk(VK_C)
-    sc_ctrl = int(MapVirtualKeyW(VK_CONTROL, MAPVK_VK_TO_VSC))
-    sc_c = int(MapVirtualKeyW(VK_C, MAPVK_VK_TO_VSC))
+_INPUT_SIZE = ctypes.sizeof(INPUT)
+
+
+def _make_combo_buf(flags: int) -> ctypes.Array:
+    buf = (INPUT * 4)()
+    for i, key_up in enumerate((False, False, True, True)):
+        buf[i].type = INPUT_KEYBOARD
+        buf[i].ki.dwFlags = flags | (KEYEVENTF_KEYUP if key_up else 0)
+    return buf
+
+
+# Ctrl down, key down, key up, Ctrl up; only the key field changes per call.
+_CTRL_SCAN_BUF = _make_combo_buf(KEYEVENTF_SCANCODE)
+_CTRL_VK_BUF = _make_combo_buf(0)
+_CTRL_VK_BUF[0].ki.wVk = VK_CONTROL
+_CTRL_VK_BUF[3].ki.wVk = VK_CONTROL
+_COMBO_LOCK = threading.Lock()
+
+
+# Synthetic combos go out once via scancode SendInput. The VK SendInput and
+# keybd_event variants are only sent when SendInput injects fewer events than
+# requested (e.g. blocked by UIPI) or as a retry (see _f1_retry_copy).
+
+
+def _send_ctrl_combo_fallback(vk: int) -> None:
+    _send_ctrl_combo_vk(vk)
+    _send_ctrl_combo_keybd(vk)
+
+
+def _send_ctrl_combo_keybd(vk: int) -> None:
+    sc_ctrl = _SCAN[VK_CONTROL]
+    sc_key = _SCAN.get(int(vk))
+    if sc_key is None:
+        sc_key = int(MapVirtualKeyW(int(vk), MAPVK_VK_TO_VSC))
     keybd_event(VK_CONTROL, sc_ctrl, 0, ULONG_PTR(0))
-    keybd_event(VK_C, sc_c, 0, ULONG_PTR(0))
-    keybd_event(VK_C, sc_c, KEYEVENTF_KEYUP, ULONG_PTR(0))
+    keybd_event(int(vk), sc_key, 0, ULONG_PTR(0))
+    keybd_event(int(vk), sc_key, KEYEVENTF_KEYUP, ULONG_PTR(0))
     keybd_event(VK_CONTROL, sc_ctrl, KEYEVENTF_KEYUP, ULONG_PTR(0))
 
 
+def _send_ctrl_c() -> None:
+    if _send_ctrl_combo_scan(VK_C) < 4:
+        _send_ctrl_combo_fallback(VK_C)
+
+
 def _send_ctrl_v() -> None:
-    sc_ctrl = int(MapVirtualKeyW(VK_CONTROL, MAPVK_VK_TO_VSC))
-    sc_v = int(MapVirtualKeyW(VK_V, MAPVK_VK_TO_VSC))
-    keybd_event(VK_CONTROL, sc_ctrl, 0, ULONG_PTR(0))
-    keybd_event(VK_V, sc_v, 0, ULONG_PTR(0))
-    keybd_event(VK_V, sc_v, KEYEVENTF_KEYUP, ULONG_PTR(0))
-    keybd_event(VK_CONTROL, sc_ctrl, KEYEVENTF_KEYUP, ULONG_PTR(0))
+    if _send_ctrl_combo_vk(VK_V) < 4:
+        _send_ctrl_combo_keybd(VK_V)
 
 
 def _send_ctrl_a() -> None:
-    _send_ctrl_combo_scan(VK_A)
-    _send_ctrl_combo_vk(VK_A)
+    if _send_ctrl_combo_scan(VK_A) < 4:
+        _send_ctrl_combo_vk(VK_A)
 
 
 def _send_ctrl_insert_copy() -> None:
-    _send_ctrl_combo_scan(VK_INSERT)
-    _send_ctrl_combo_vk(VK_INSERT)
-    sc_ctrl = int(MapVirtualKeyW(VK_CONTROL, MAPVK_VK_TO_VSC))
-    sc_ins = int(MapVirtualKeyW(VK_INSERT, MAPVK_VK_TO_VSC))
-    keybd_event(VK_CONTROL, sc_ctrl, 0, ULONG_PTR(0))
-    keybd_event(VK_INSERT, sc_ins, 0, ULONG_PTR(0))
-    keybd_event(VK_INSERT, sc_ins, KEYEVENTF_KEYUP, ULONG_PTR(0))
-    keybd_event(VK_CONTROL, sc_ctrl, KEYEVENTF_KEYUP, ULONG_PTR(0))
+    if _send_ctrl_combo_scan(VK_INSERT) < 4:
+        _send_ctrl_combo_fallback(VK_INSERT)
 
 
 def _refocus(hwnd: int) -> None:
     if not hwnd:
         return
-    cur_tid = int(GetCurrentThreadId())
+    if int(GetForegroundWindow() or 0) == int(hwnd):
+        return
+    cur_tid = _MAIN_TID
     pid = wintypes.DWORD(0)
     fg_tid = int(GetWindowThreadProcessId(wintypes.HWND(hwnd), ctypes.byref(pid)))
     if fg_tid:
@@ -350,50 +505,78 @@ def _refocus(hwnd: int) -> None:
         AttachThreadInput(wintypes.DWORD(cur_tid), wintypes.DWORD(fg_tid), False)
 
 
-def _send_ctrl_combo_scan(vk: int) -> None:
-    extra = ULONG_PTR(0)
-    sc_ctrl = int(MapVirtualKeyW(VK_CONTROL, MAPVK_VK_TO_VSC))
-    sc_key = int(MapVirtualKeyW(int(vk), MAPVK_VK_TO_VSC))
-    inputs = (INPUT * 4)(
-        INPUT(type=INPUT_KEYBOARD, ki=KEYBDINPUT(0, sc_ctrl, KEYEVENTF_SCANCODE, 0, extra)),
-        INPUT(type=INPUT_KEYBOARD, ki=KEYBDINPUT(0, sc_key, KEYEVENTF_SCANCODE, 0, extra)),
-        INPUT(type=INPUT_KEYBOARD, ki=KEYBDINPUT(0, sc_key, KEYEVENTF_SCANCODE | KEYEVENTF_KEYUP, 0, extra)),
-        INPUT(type=INPUT_KEYBOARD, ki=KEYBDINPUT(0, sc_ctrl, KEYEVENTF_SCANCODE | KEYEVENTF_KEYUP, 0, extra)),
-    )
-    SendInput(len(inputs), ctypes.byref(inputs), ctypes.sizeof(INPUT))
-
-
-def _send_ctrl_combo_vk(vk: int) -> None:
-    extra = ULONG_PTR(0)
-    inputs = (INPUT * 4)(
-        INPUT(type=INPUT_KEYBOARD, ki=KEYBDINPUT(VK_CONTROL, 0, 0, 0, extra)),
-        INPUT(type=INPUT_KEYBOARD, ki=KEYBDINPUT(int(vk), 0, 0, 0, extra)),
-        INPUT(type=INPUT_KEYBOARD, ki=KEYBDINPUT(int(vk), 0, KEYEVENTF_KEYUP, 0, extra)),
-        INPUT(type=INPUT_KEYBOARD, ki=KEYBDINPUT(VK_CONTROL, 0, KEYEVENTF_KEYUP, 0, extra)),
-    )
-    SendInput(len(inputs), ctypes.byref(inputs), ctypes.sizeof(INPUT))
+def _send_ctrl_combo_scan(vk: int) -> int:
+    sc_ctrl = _SCAN[VK_CONTROL]
+    sc_key = _SCAN.get(int(vk))
+    if sc_key is None:
+        sc_key = int(MapVirtualKeyW(int(vk), MAPVK_VK_TO_VSC))
+    with _COMBO_LOCK:
+        buf = _CTRL_SCAN_BUF
+        buf[0].ki.wScan = sc_ctrl
+        buf[1].ki.wScan = sc_key
+        buf[2].ki.wScan = sc_key
+        buf[3].ki.wScan = sc_ctrl
+        return int(SendInput(4, ctypes.byref(buf), _INPUT_SIZE))
+
+
+def _send_ctrl_combo_vk(vk: int) -> int:
+    sc_ctrl = _SCAN[VK_CONTROL]
+    sc_key = _SCAN.get(int(vk))
+    if sc_key is None:
+        sc_key = int(MapVirtualKeyW(int(vk), MAPVK_VK_TO_VSC))
+    with _COMBO_LOCK:
+        buf = _CTRL_VK_BUF
+        buf[0].ki.wScan = sc_ctrl
+        buf[1].ki.wVk = int(vk)
+        buf[1].ki.wScan = sc_key
+        buf[2].ki.wVk = int(vk)
+        buf[2].ki.wScan = sc_key
+        buf[3].ki.wScan = sc_ctrl
+        return int(SendInput(4, ctypes.byref(buf), _INPUT_SIZE))
+
+
+def _send_text_input(text: str) -> bool:
+    if not text:
+        return True
+    # KEYEVENTF_UNICODE takes UTF-16 code units, so characters outside the BMP
+    # are sent as their surrogate pair (one down/up per unit).
+    units = memoryview(text.encode("utf-16-le")).cast("H")
+    n = len(units)
+    inputs = (INPUT * (2 * n))()
+    for i, w_scan in enumerate(units):
+        down = inputs[2 * i]
+        down.type = INPUT_KEYBOARD
+        down.ki.wScan = w_scan
+        down.ki.dwFlags = KEYEVENTF_UNICODE
+        up = inputs[2 * i + 1]
+        up.type = INPUT_KEYBOARD
+        up.ki.wScan = w_scan
+        up.ki.dwFlags = KEYEVENTF_UNICODE | KEYEVENTF_KEYUP
+    return int(SendInput(2 * n, ctypes.byref(inputs), _INPUT_SIZE)) == 2 * n
+
+
+_CLIPBOARD_OPEN_BACKOFF = (0.001, 0.002, 0.004, 0.008)
+
+
+def _open_clipboard() -> bool:
+    if OpenClipboard(None):
+        return True
+    for delay in _CLIPBOARD_OPEN_BACKOFF:
+        time.sleep(delay)
+        if OpenClipboard(None):
+            return True
+    return False
 
 
-def _send_text_input(text: str) -> None:
-    if not text:
-        return
-    extra = ULONG_PTR(0)
-    for ch in text:
-        w_scan = ord(ch)
-        inputs = (INPUT * 2)(
-            INPUT(type=INPUT_KEYBOARD, ki=KEYBDINPUT(0, w_scan, KEYEVENTF_UNICODE, 0, extra)),
-            INPUT(type=INPUT_KEYBOARD, ki=KEYBDINPUT(0, w_scan, KEYEVENTF_UNICODE | KEYEVENTF_KEYUP, 0, extra)),
-        )
-        SendInput(2, ctypes.byref(inputs), ctypes.sizeof(INPUT))
-        time.sleep(0.01)
+def _clipboard_ready() -> bool:
+    if not OpenClipboard(None):
+        return False
+    CloseClipboard()
+    return True
 
 
 def _get_clipboard_text_win32() -> str:
-    for _ in range(12):
-        if OpenClipboard(None):
-            break
-        time.sleep(0.005)
-    else:
+    if not _open_clipboard():
         return ""
     try:
         if not IsClipboardFormatAvailable(CF_UNICODETEXT):
@@ -405,12 +588,11 @@ def _get_clipboard_text_win32() -> str:
         if not p:
             return ""
         try:
-            size = int(GlobalSize(h))
-            if size <= 0:
+            cap = min(int(GlobalSize(h)) // 2, _CLIPBOARD_MAX_CHARS)
+            if cap <= 0:
                 return ""
-            raw = ctypes.string_at(p, size)
             try:
-                return raw.decode("utf-16-le", errors="ignore").split("\x00", 1)[0]
+                return ctypes.wstring_at(p, int(_wcsnlen(p, cap)))
             except Exception:
                 return ""
         finally:
@@ -419,6 +601,14 @@ def _get_clipboard_text_win32() -> str:
         CloseClipboard()
 
 
+_BTN_DOWN_MSGS = frozenset({WM_LBUTTONDOWN, WM_RBUTTONDOWN, WM_MBUTTONDOWN, WM_XBUTTONDOWN})
+
+_DISMISS_CLOSE_POPUP = 0x1
+_DISMISS_CLOSE_SHOT = 0x2
+_DISMISS_HIDE_POPUP = 0x4
+_DISMISS_F2_CANCEL = 0x8
+
+
 class _GlobalDismissHooks(QObject):
     def __init__(self, popup: FloatingPopup, shot: ScreenshotResultOverlay) -> None:
         super().__init__()
@@ -426,8 +616,22 @@ class _GlobalDismissHooks(QObject):
         self._shot = shot
         self._kbd_hook: wintypes.HHOOK | None = None
         self._mouse_hook: wintypes.HHOOK | None = None
-        self._kbd_proc: object | None = None
-        self._mouse_proc: object | None = None
+        # Created once and kept for the lifetime of the object; the hooks are
+        # installed and removed around them as popups come and go.
+        self._kbd_proc = LowLevelKeyboardProc(self._kbd_callback)
+        self._mouse_proc = LowLevelMouseProc(self._mouse_callback)
+        # Screen rects (left, top, right, bottom) of the visible windows, or None
+        # when hidden. Refreshed on move/resize/show/hide so the hook procs only
+        # do integer compares.
+        self._popup_rect: tuple[int, int, int, int] | None = None
+        self._shot_rect: tuple[int, int, int, int] | None = None
+        self._popup.geometry_changed.connect(self._refresh_popup_rect)
+        self._shot.geometry_changed.connect(self._refresh_shot_rect)
+        # Plain flags mirrored from Qt signals; the keyboard hook reads only these.
+        self._popup_active = False
+        self._popup_typing = False
+        self._popup.mode_changed.connect(self._on_popup_mode_changed)
+        QGuiApplication.instance().focusWindowChanged.connect(self._on_focus_window_changed)
 
     def enable(self) -> None:
         if self._kbd_hook is None:
@@ -443,80 +647,119 @@ class _GlobalDismissHooks(QObject):
     def shutdown(self) -> None:
         self._uninstall_all()
 
-    def _install_keyboard(self) -> None:
-        @LowLevelKeyboardProc
-        def _proc(nCode, wParam, lParam):
-            if nCode >= 0 and wParam in (WM_KEYDOWN, WM_SYSKEYDOWN):
-                info = ctypes.cast(lParam, ctypes.POINTER(KBDLLHOOKSTRUCT)).contents
-                if int(info.vkCode) == VK_ESCAPE:
-                    if self._popup.isVisible() or self._shot.isVisible():
-                        if self._popup.isVisible() and self._popup.isActiveWindow():
-                            return CallNextHookEx(self._kbd_hook or 0, nCode, wParam, lParam)
-                        if self._popup.isVisible() and self._popup.input_edit.isVisible():
-                            QTimer.singleShot(
-                                0, lambda: self._popup.f2_canceled_with_paste.emit(self._popup.input_edit.toPlainText())
-                            )
-                            QTimer.singleShot(0, self._popup.hide)
-                        else:
-                            QTimer.singleShot(0, self._popup.close)
-                        QTimer.singleShot(0, self._shot.close)
-            return CallNextHookEx(self._kbd_hook or 0, nCode, wParam, lParam)
-
-        self._kbd_proc = _proc
-        hmod = GetModuleHandleW(None)
-        self._kbd_hook = SetWindowsHookExW(WH_KEYBOARD_LL, ctypes.cast(_proc, ctypes.c_void_p), hmod, 0)
+    def _refresh_popup_rect(self) -> None:
+        self._popup_rect = self._window_rect(self._popup)
 
-    def _install_mouse(self) -> None:
-        @LowLevelMouseProc
-        def _proc(nCode, wParam, lParam):
-            if nCode >= 0 and wParam in (WM_LBUTTONDOWN, WM_RBUTTONDOWN, WM_MBUTTONDOWN, WM_XBUTTONDOWN):
-                info = ctypes.cast(lParam, ctypes.POINTER(MSLLHOOKSTRUCT)).contents
-                x = int(info.pt.x)
-                y = int(info.pt.y)
-                if self._popup.isVisible():
-                    try:
-                        r = RECT()
-                        hwnd = wintypes.HWND(int(self._popup.winId()))
-                        if GetWindowRect(hwnd, ctypes.byref(r)):
-                            if not (r.left <= x <= r.right and r.top <= y <= r.bottom):
-                                QTimer.singleShot(0, self._popup.close)
-                    except Exception:
-                        if not self._popup.geometry().contains(x, y):
-                            QTimer.singleShot(0, self._popup.close)
-                if self._shot.isVisible():
-                    try:
-                        r = RECT()
-                        hwnd = wintypes.HWND(int(self._shot.winId()))
-                        if GetWindowRect(hwnd, ctypes.byref(r)):
-                            if not (r.left <= x <= r.right and r.top <= y <= r.bottom):
-                                QTimer.singleShot(0, self._shot.close)
-                    except Exception:
-                        if not self._shot.geometry().contains(x, y):
-                            QTimer.singleShot(0, self._shot.close)
+    def _refresh_shot_rect(self) -> None:
+        self._shot_rect = self._window_rect(self._shot)
+
+    def _on_popup_mode_changed(self, mode: str) -> None:
+        self._popup_typing = mode == "F2"
+
+    def _on_focus_window_changed(self, _window) -> None:
+        self._popup_active = self._popup.isActiveWindow()
+
+    def _window_rect(self, widget) -> tuple[int, int, int, int] | None:
+        if not widget.isVisible():
+            return None
+        try:
+            r = RECT()
+            if GetWindowRect(wintypes.HWND(int(widget.winId())), ctypes.byref(r)):
+                return int(r.left), int(r.top), int(r.right), int(r.bottom)
+        except Exception:
+            pass
+        g = widget.geometry()
+        return g.left(), g.top(), g.right(), g.bottom()
+
+    def _kbd_callback(self, nCode, wParam, lParam):
+        if nCode >= 0 and (wParam == WM_KEYDOWN or wParam == WM_SYSKEYDOWN):
+            if KBDLLHOOKSTRUCT.from_address(lParam).vkCode != VK_ESCAPE:
+                return CallNextHookEx(self._kbd_hook or 0, nCode, wParam, lParam)
+            popup_visible = self._popup_rect is not None
+            if popup_visible or self._shot_rect is not None:
+                if popup_visible and self._popup_active:
+                    return CallNextHookEx(self._kbd_hook or 0, nCode, wParam, lParam)
+                if popup_visible and self._popup_typing:
+                    actions = _DISMISS_F2_CANCEL | _DISMISS_HIDE_POPUP | _DISMISS_CLOSE_SHOT
+                else:
+                    actions = _DISMISS_CLOSE_POPUP | _DISMISS_CLOSE_SHOT
+                QTimer.singleShot(0, lambda a=actions: self._apply(a))
+        return CallNextHookEx(self._kbd_hook or 0, nCode, wParam, lParam)
+
+    def _mouse_callback(self, nCode, wParam, lParam):
+        if wParam == WM_MOUSEMOVE:
             return CallNextHookEx(self._mouse_hook or 0, nCode, wParam, lParam)
+        if nCode >= 0 and wParam in _BTN_DOWN_MSGS:
+            pr = self._popup_rect
+            sr = self._shot_rect
+            if pr is not None or sr is not None:
+                pt = MSLLHOOKSTRUCT.from_address(lParam).pt
+                x = pt.x
+                y = pt.y
+                actions = 0
+                if pr is not None and not (pr[0] <= x <= pr[2] and pr[1] <= y <= pr[3]):
+                    actions |= _DISMISS_CLOSE_POPUP
+                if sr is not None and not (sr[0] <= x <= sr[2] and sr[1] <= y <= sr[3]):
+                    actions |= _DISMISS_CLOSE_SHOT
+                if actions:
+                    QTimer.singleShot(0, lambda a=actions: self._apply(a))
+        return CallNextHookEx(self._mouse_hook or 0, nCode, wParam, lParam)
+
+    def _apply(self, actions: int) -> None:
+        if actions & _DISMISS_F2_CANCEL:
+            self._popup.f2_canceled_with_paste.emit(self._popup.input_edit.toPlainText())
+        if actions & _DISMISS_HIDE_POPUP:
+            self._popup.hide()
+        if actions & _DISMISS_CLOSE_POPUP:
+            self._popup.close()
+        if actions & _DISMISS_CLOSE_SHOT:
+            self._shot.close()
 
-        self._mouse_proc = _proc
-        hmod = GetModuleHandleW(None)
-        self._mouse_hook = SetWindowsHookExW(WH_MOUSE_LL, ctypes.cast(_proc, ctypes.c_void_p), hmod, 0)
+    def _install_keyboard(self) -> None:
+        self._kbd_hook = SetWindowsHookExW(WH_KEYBOARD_LL, ctypes.cast(self._kbd_proc, ctypes.c_void_p), _HMOD, 0)
+
+    def _install_mouse(self) -> None:
+        self._mouse_hook = SetWindowsHookExW(WH_MOUSE_LL, ctypes.cast(self._mouse_proc, ctypes.c_void_p), _HMOD, 0)
 
     def _uninstall_all(self) -> None:
         if self._kbd_hook is not None:
             UnhookWindowsHookEx(self._kbd_hook)
             self._kbd_hook = None
-            self._kbd_proc = None
         if self._mouse_hook is not None:
             UnhookWindowsHookEx(self._mouse_hook)
             self._mouse_hook = None
-            self._mouse_proc = None
 
 
 class GlobalHotkeyManager(QObject):
     hotkey_pressed = Signal(int)
+    clipboard_updated = Signal()
 
     def __init__(self) -> None:
         super().__init__()
         self._registered: set[int] = set()
-        self._filter = _HotkeyNativeEventFilter(self.hotkey_pressed)
+        self._filter = _HotkeyNativeEventFilter(self.hotkey_pressed, self.clipboard_updated)
+        self._clip_hwnd = 0
+
+    def start_clipboard_listener(self) -> bool:
+        if self._clip_hwnd:
+            return True
+        hwnd = CreateWindowExW(0, "STATIC", "FlashTransClipboard", 0, 0, 0, 0, 0, HWND_MESSAGE, None, None, None)
+        if not hwnd:
+            return False
+        if not AddClipboardFormatListener(hwnd):
+            DestroyWindow(hwnd)
+            return False
+        self._clip_hwnd = int(hwnd)
+        self._filter.clip_hwnd = self._clip_hwnd
+        return True
+
+    def stop_clipboard_listener(self) -> None:
+        hwnd = self._clip_hwnd
+        self._clip_hwnd = 0
+        self._filter.clip_hwnd = 0
+        if hwnd:
+            RemoveClipboardFormatListener(hwnd)
+            DestroyWindow(hwnd)
 
     def register_hotkeys(self, hotkeys: dict[int, tuple[int, int]]) -> dict[int, bool]:
         QGuiApplication.instance().installNativeEventFilter(self._filter)
@@ -545,10 +788,15 @@ class GlobalHotkeyManager(QObject):
         return ok
 
 
+_MSG_MESSAGE_OFFSET = wintypes.MSG.message.offset
+
+
 class _HotkeyNativeEventFilter(QAbstractNativeEventFilter):
-    def __init__(self, signal: Signal) -> None:
+    def __init__(self, signal: Signal, clipboard_signal: Signal) -> None:
         super().__init__()
         self._signal = signal
+        self._clipboard_signal = clipboard_signal
+        self.clip_hwnd = 0
 
     def nativeEventFilter(self, eventType, message):
         if eventType not in ("windows_generic_MSG", "windows_dispatcher_MSG"):
@@ -557,10 +805,19 @@ class _HotkeyNativeEventFilter(QAbstractNativeEventFilter):
             addr = int(message)
         except Exception:
             return False, 0
-        msg = wintypes.MSG.from_address(addr)
-        if msg.message == WM_HOTKEY:
-            self._signal.emit(int(msg.wParam))
+        msg_id = ctypes.c_uint.from_address(addr + _MSG_MESSAGE_OFFSET).value
+        if msg_id == WM_HOTKEY:
+            self._signal.emit(int(wintypes.MSG.from_address(addr).wParam))
             return True, 0
+        if msg_id == WM_CLIPBOARDUPDATE:
+            # Qt's own clipboard window listens too; only consume our listener's copy.
+            hwnd = ctypes.c_void_p.from_address(addr).value or 0
+            if not self.clip_hwnd or hwnd != self.clip_hwnd:
+                return False, 0
+            self._clipboard_signal.emit()
+            return True, 0
+        if msg_id == WM_INPUTLANGCHANGE:
+            refresh_scancodes()
         return False, 0
 
 
@@ -576,6 +833,8 @@ class EngineWorker(QObject):
         self._llm_cfg: LlmConfig | None = None
         self._local_qwen: LocalQwen | None = None
         self._qwen_model_path: Path | None = None
+        self._images: dict[int, QImage] = {}
+        self._images_lock = threading.Lock()
         if qwen_model_path is not None and str(qwen_model_path):
             try:
                 p = Path(qwen_model_path)
@@ -589,24 +848,31 @@ class EngineWorker(QObject):
             except Exception:
                 self._local_qwen = None
 
-    @Slot(int, str)
-    def translate_en2zh(self, req_id: int, text: str) -> None:
+    @Slot()
+    def warmup(self) -> None:
+        try:
+            self._engine.warmup()
+        except Exception:
+            pass
+
+    @Slot(int, str, int)
+    def translate_en2zh(self, req_id: int, text: str, beam_size: int) -> None:
         try:
             if self._local_qwen is not None:
                 translated = self._local_qwen.translate(text, target_lang="zh")
             else:
-                translated = self._engine.translate_en2zh(text)
+                translated = self._engine.translate_en2zh(text, beam_size=int(beam_size))
             self.text_done.emit(int(req_id), translated)
         except Exception as e:
             self.failed.emit(int(req_id), str(e))
 
-    @Slot(int, str)
-    def translate_zh2en(self, req_id: int, text: str) -> None:
+    @Slot(int, str, int)
+    def translate_zh2en(self, req_id: int, text: str, beam_size: int) -> None:
         try:
             if self._local_qwen is not None:
                 translated = self._local_qwen.translate(text, target_lang="en")
             else:
-                translated = self._engine.translate_zh2en(text)
+                translated = self._engine.translate_zh2en(text, beam_size=int(beam_size))
             self.text_done.emit(int(req_id), translated)
         except Exception as e:
             self.failed.emit(int(req_id), str(e))
@@ -734,8 +1000,17 @@ class EngineWorker(QObject):
                 return
             self.failed.emit(int(req_id), str(e))
 
-    @Slot(int, QImage)
-    def process_image(self, req_id: int, image: QImage) -> None:
+    def stash_image(self, req_id: int, image: QImage) -> None:
+        with self._images_lock:
+            self._images[int(req_id)] = image
+
+    @Slot(int)
+    def process_image(self, req_id: int) -> None:
+        with self._images_lock:
+            image = self._images.pop(int(req_id), None)
+        if image is None:
+            self.failed.emit(int(req_id), "Screenshot image missing")
+            return
         try:
             source, target = self._engine.process_image(image)
             self.image_done.emit(int(req_id), source, target)
@@ -744,20 +1019,21 @@ class EngineWorker(QObject):
 
 
 class AppController(QObject):
-    request_text_en2zh = Signal(int, str)
-    request_text_zh2en = Signal(int, str)
+    request_text_en2zh = Signal(int, str, int)
+    request_text_zh2en = Signal(int, str, int)
     request_text_nllb = Signal(int, str, str, str)
-    request_image = Signal(int, QImage)
+    request_image = Signal(int)
     request_llm_translate = Signal(int, str, str, bool)
     request_llm_chat = Signal(int, object)
     request_llm_settings = Signal(object)
+    request_warmup = Signal()
 
     def __init__(
         self,
         tray: QSystemTrayIcon,
         overlay: SnippingOverlay,
         engine: CoreEngine,
-        dashboard: DashboardWindow,
+        dashboard_factory: Callable[[], DashboardWindow],
         flavor: str = "opus",
         qwen_model_path: Path | None = None,
     ) -> None:
@@ -765,7 +1041,8 @@ class AppController(QObject):
         self._tray = tray
         self._overlay = overlay
         self._engine = engine
-        self._dashboard = dashboard
+        self._dashboard_factory = dashboard_factory
+        self._dashboard: DashboardWindow | None = None
         self._flavor = str(flavor or "opus").strip().lower()
         self._qwen_model_path = qwen_model_path
 
@@ -787,17 +1064,24 @@ class AppController(QObject):
         self._shot_close_timer.timeout.connect(self._shot_overlay.close)
 
         self._busy_image = False
-        self._next_req_id = 1
-        self._pending: dict[int, tuple[str, object]] = {}
+        self._req_id_gen = itertools.count(1)
+        self._pending: list[tuple[int, int, object] | None] = [None] * _PENDING_SLOTS
+        self._inflight: dict[tuple[int, object], int] = {}
         self._last_shot_source = ""
         self._last_shot_target = ""
         self._last_shot_rect: object | None = None
         self._f2_req_id: int | None = None
         self._f2_target_hwnd: int | None = None
+        self._paste_pending = False
+        self._paste_hwnd = 0
+        self._paste_text = ""
+        self._paste_tries = 0
+        self._clip_seq = 0
+        self._clip_text = ""
         self._f1_ctx: dict[str, object] | None = None
-        self._f1_timer = QTimer(self)
-        self._f1_timer.setInterval(15)
-        self._f1_timer.timeout.connect(self._poll_f1_clipboard)
+        # Only used when the clipboard listener could not be registered.
+        self._f1_poll_timer: QTimer | None = None
+        self._xlat_cache: OrderedDict[tuple[bool, str], str] = OrderedDict()
 
         self._thread = QThread()
         self._worker = EngineWorker(engine, qwen_model_path=qwen_model_path)
@@ -809,6 +1093,7 @@ class AppController(QObject):
         self.request_llm_translate.connect(self._worker.llm_translate, Qt.QueuedConnection)
         self.request_llm_chat.connect(self._worker.llm_chat, Qt.QueuedConnection)
         self.request_llm_settings.connect(self._worker.update_llm_settings, Qt.QueuedConnection)
+        self.request_warmup.connect(self._worker.warmup, Qt.QueuedConnection)
         self._worker.text_done.connect(self._on_text_done, Qt.QueuedConnection)
         self._worker.image_done.connect(self._on_image_done, Qt.QueuedConnection)
         self._worker.chat_done.connect(self._on_chat_done, Qt.QueuedConnection)
@@ -818,10 +1103,6 @@ class AppController(QObject):
         self._overlay.captured.connect(self._on_screenshot_captured)
         self._overlay.canceled.connect(self._on_screenshot_canceled)
 
-        self._dashboard.translate_requested.connect(self._dashboard_translate)
-        self._dashboard.copy_source_requested.connect(self._dashboard_copy_source)
-        self._dashboard.copy_target_requested.connect(self._dashboard_copy_target)
-        self._dashboard.clear_requested.connect(self._dashboard_clear)
         self._store = SettingsStore()
         self._chat = ChatWindow()
         self._chat.message_submitted.connect(self._on_chat_message)
@@ -829,16 +1110,28 @@ class AppController(QObject):
         self._last_context: dict[str, str] = {"title": "", "source": "", "translated": ""}
         self._sync_llm_settings()
 
-        if self._flavor == "nllb":
-            self._dashboard.set_backend_info("NLLB 1.3B (OpenNMT CT2 int8)")
-        elif self._flavor == "qwen":
-            self._dashboard.set_backend_info("Qwen3 (local GGUF)")
-        else:
-            self._dashboard.set_backend_info("Opus-MT (CT2 int8)")
+    @property
+    def dashboard(self) -> DashboardWindow:
+        if self._dashboard is None:
+            d = self._dashboard_factory()
+            d.translate_requested.connect(self._dashboard_translate)
+            d.copy_source_requested.connect(self._dashboard_copy_source)
+            d.copy_target_requested.connect(self._dashboard_copy_target)
+            d.clear_requested.connect(self._dashboard_clear)
+            if self._flavor == "nllb":
+                d.set_backend_info("NLLB 1.3B (OpenNMT CT2 int8)")
+            elif self._flavor == "qwen":
+                d.set_backend_info("Qwen3 (local GGUF)")
+            else:
+                d.set_backend_info("Opus-MT (CT2 int8)")
+            self._dashboard = d
+        return self._dashboard
 
     def shutdown(self) -> None:
         self._dismiss_hooks.shutdown()
-        self._f1_timer.stop()
+        self._f1_ctx = None
+        if self._f1_poll_timer is not None:
+            self._f1_poll_timer.stop()
         self._thread.quit()
         self._thread.wait(1500)
 
@@ -869,22 +1162,23 @@ class AppController(QObject):
             self._chat.set_input_text(initial_text)
 
     def on_hotkey_f5(self) -> None:
-        if not self._dashboard:
-            return
-        if self._dashboard.isMinimized():
-            self._dashboard.showNormal()
-        elif not self._dashboard.isVisible():
-            self._dashboard.show()
-        self._dashboard.adjustSize()
+        if self.dashboard.isMinimized():
+            self.dashboard.showNormal()
+        elif not self.dashboard.isVisible():
+            self.dashboard.show()
+        self.dashboard.adjustSize()
+        self._center_on_cursor_screen(self.dashboard)
+        self.dashboard.raise_()
+        self.dashboard.activateWindow()
+        self.dashboard.setFocus()
+
+    def _center_on_cursor_screen(self, widget) -> None:
         screen = QGuiApplication.screenAt(QCursor.pos()) or QGuiApplication.primaryScreen()
         geom = screen.availableGeometry() if screen is not None else QRect(0, 0, 1920, 1080)
-        size = self._dashboard.size()
-        x = geom.center().x() - size.width() // 2
-        y = geom.center().y() - size.height() // 2
-        self._dashboard.move(max(geom.left(), x), max(geom.top(), y))
-        self._dashboard.raise_()
-        self._dashboard.activateWindow()
-        self._dashboard.setFocus()
+        frame = widget.frameGeometry()
+        x = geom.center().x() - frame.width() // 2
+        y = geom.center().y() - frame.height() // 2
+        widget.move(max(geom.left(), x), max(geom.top(), y))
 
     def on_hotkey_f1(self) -> None:
         if self._popup.isVisible():
@@ -901,8 +1195,6 @@ class AppController(QObject):
             "anchor": anchor,
             "seq0": seq0,
             "initial_text": initial_text,
-            "t0": time.monotonic(),
-            "sent_insert": False,
         }
 
         self._popup.open_f1(anchor, "", "读取选中文本...")
@@ -911,93 +1203,87 @@ class AppController(QObject):
 
         _refocus(hwnd)
         _send_ctrl_c()
-        self._f1_timer.start()
+        ctx = self._f1_ctx
+        QTimer.singleShot(30, lambda: self._f1_retry_copy(ctx))
+        QTimer.singleShot(250, lambda: self._f1_insert_copy(ctx))
+        QTimer.singleShot(900, lambda: self._f1_bailout(ctx))
+        if self._f1_poll_timer is not None:
+            self._f1_poll_timer.start()
+
+    def enable_f1_clipboard_poll(self) -> None:
+        if self._f1_poll_timer is not None:
+            return
+        self._f1_poll_timer = QTimer(self)
+        self._f1_poll_timer.setInterval(15)
+        self._f1_poll_timer.timeout.connect(self._poll_f1_clipboard)
 
     def _poll_f1_clipboard(self) -> None:
+        if not self._f1_ctx:
+            self._f1_poll_timer.stop()
+            return
+        self.on_clipboard_updated()
+
+    def on_clipboard_updated(self) -> None:
         ctx = self._f1_ctx
         if not ctx:
-            self._f1_timer.stop()
             return
-
-        anchor = ctx.get("anchor")
-        if anchor is None:
-            self._f1_ctx = None
-            self._f1_timer.stop()
+        seq_now = int(GetClipboardSequenceNumber())
+        if seq_now == int(ctx.get("seq0", 0)):
             return
-
         cb = QApplication.clipboard()
-        seq0 = int(ctx.get("seq0", 0))
-        initial_text = str(ctx.get("initial_text", "") or "")
-        t0 = float(ctx.get("t0", 0.0))
-        sent_insert = bool(ctx.get("sent_insert", False))
-
         text = (_get_clipboard_text_win32() or (cb.text() or "")).strip()
-        seq_now = int(GetClipboardSequenceNumber())
-
-        if text and (seq_now != seq0 or text != initial_text):
-            self._f1_timer.stop()
+        if text:
             self._f1_ctx = None
-            self._popup.open_f1(anchor, text, "Translating...")
-            req_id = self._alloc_req_id()
-            is_zh = bool(re.search(r"[\u4e00-\u9fff]", text))
-            if self._flavor == "qwen":
-                target_lang = "en" if is_zh else "zh"
-                use_api = False
-                self._pending[req_id] = ("F1_LLM", (anchor, text))
-                self.request_llm_translate.emit(req_id, text, target_lang, bool(use_api))
-            else:
-                self._pending[req_id] = ("F1", (anchor, text, is_zh))
-                if is_zh:
-                    self.request_text_zh2en.emit(req_id, text)
-                else:
-                    self.request_text_en2zh.emit(req_id, text)
+            self._start_f1_translate(ctx["anchor"], text)
+
+    def _f1_retry_copy(self, ctx: dict[str, object]) -> None:
+        if self._f1_ctx is not ctx:
             return
+        if int(GetClipboardSequenceNumber()) == int(ctx.get("seq0", 0)):
+            _send_ctrl_combo_fallback(VK_C)
 
-        elapsed = time.monotonic() - t0
-        if (not sent_insert) and elapsed >= 0.25:
-            ctx["sent_insert"] = True
-            _refocus(int(ctx.get("hwnd", 0)))
-            _send_ctrl_insert_copy()
+    def _f1_insert_copy(self, ctx: dict[str, object]) -> None:
+        if self._f1_ctx is not ctx:
             return
+        _refocus(int(ctx.get("hwnd", 0)))
+        _send_ctrl_insert_copy()
 
-        if elapsed >= 0.9:
-            self._f1_timer.stop()
-            self._f1_ctx = None
-            if text:
-                self._popup.open_f1(anchor, text, "Translating...")
-                req_id = self._alloc_req_id()
-                is_zh = bool(re.search(r"[\u4e00-\u9fff]", text))
-                if self._flavor == "qwen":
-                    target_lang = "en" if is_zh else "zh"
-                    use_api = False
-                    self._pending[req_id] = ("F1_LLM", (anchor, text))
-                    self.request_llm_translate.emit(req_id, text, target_lang, bool(use_api))
-                else:
-                    self._pending[req_id] = ("F1", (anchor, text, is_zh))
-                    if is_zh:
-                        self.request_text_zh2en.emit(req_id, text)
-                    else:
-                        self.request_text_en2zh.emit(req_id, text)
-                return
-            if initial_text:
-                self._popup.open_f1(anchor, initial_text, "Translating...")
-                req_id = self._alloc_req_id()
-                is_zh = bool(re.search(r"[\u4e00-\u9fff]", initial_text))
-                if self._flavor == "qwen":
-                    target_lang = "en" if is_zh else "zh"
-                    use_api = False
-                    self._pending[req_id] = ("F1_LLM", (anchor, initial_text))
-                    self.request_llm_translate.emit(req_id, initial_text, target_lang, bool(use_api))
-                else:
-                    self._pending[req_id] = ("F1", (anchor, initial_text, is_zh))
-                    if is_zh:
-                        self.request_text_zh2en.emit(req_id, initial_text)
-                    else:
-                        self.request_text_en2zh.emit(req_id, initial_text)
-                return
-            self._popup.show_error(anchor, "F1 (EN→ZH)", "未获取到选中文本（请确保已选中文字）")
-            self._popup_close_timer.start(4000)
+    def _f1_bailout(self, ctx: dict[str, object]) -> None:
+        if self._f1_ctx is not ctx:
+            return
+        self._f1_ctx = None
+        anchor = ctx["anchor"]
+        text = ""
+        if int(GetClipboardSequenceNumber()) != int(ctx.get("seq0", 0)):
+            cb = QApplication.clipboard()
+            text = (_get_clipboard_text_win32() or (cb.text() or "")).strip()
+        text = text or str(ctx.get("initial_text", "") or "")
+        if text:
+            self._start_f1_translate(anchor, text)
             return
+        self._popup.show_error(anchor, "F1 (EN→ZH)", "未获取到选中文本（请确保已选中文字）")
+        self._popup_close_timer.start(4000)
+
+    def _start_f1_translate(self, anchor: QPoint, text: str) -> None:
+        is_zh = _has_cjk(text)
+        if self._flavor != "qwen":
+            cached = self._cache_get(is_zh, text)
+            if cached is not None:
+                self._show_f1_result(anchor, text, cached)
+                return
+        self._popup.open_f1(anchor, text, "Translating...")
+        req_id = next(self._req_id_gen)
+        if self._flavor == "qwen":
+            target_lang = "en" if is_zh else "zh"
+            use_api = False
+            self._track(req_id, _MODE_F1_LLM, PendingF1Llm(anchor, text))
+            self.request_llm_translate.emit(req_id, text, target_lang, bool(use_api))
+        else:
+            self._track(req_id, _MODE_F1, PendingF1(anchor, text, is_zh))
+            if is_zh:
+                self.request_text_zh2en.emit(req_id, text, _BEAM_INTERACTIVE)
+            else:
+                self.request_text_en2zh.emit(req_id, text, _BEAM_INTERACTIVE)
 
     def on_hotkey_f2(self) -> None:
         self._f2_target_hwnd = int(GetForegroundWindow())
@@ -1005,20 +1291,20 @@ class AppController(QObject):
 
         def _enter(text: str) -> None:
             self._popup.set_f2_translating()
-            req_id = self._alloc_req_id()
+            req_id = next(self._req_id_gen)
             self._f2_req_id = req_id
-            is_zh = bool(re.search(r"[\u4e00-\u9fff]", text or ""))
+            is_zh = _has_cjk(text or "")
             if self._flavor == "qwen":
                 target_lang = "en" if is_zh else "zh"
                 use_api = False
-                self._pending[req_id] = ("F2_LLM", None)
+                self._track(req_id, _MODE_F2_LLM, None)
                 self.request_llm_translate.emit(req_id, text, target_lang, bool(use_api))
             else:
-                self._pending[req_id] = ("F2", is_zh)
+                self._track(req_id, _MODE_F2, is_zh)
                 if is_zh:
-                    self.request_text_zh2en.emit(req_id, text)
+                    self.request_text_zh2en.emit(req_id, text, _BEAM_INTERACTIVE)
                 else:
-                    self.request_text_en2zh.emit(req_id, text)
+                    self.request_text_en2zh.emit(req_id, text, _BEAM_INTERACTIVE)
 
         self._popup.open_f2(anchor, _enter)
         self._dismiss_hooks.enable()
@@ -1031,10 +1317,94 @@ class AppController(QObject):
             return
         self._overlay.begin()
 
-    def _alloc_req_id(self) -> int:
-        rid = self._next_req_id
-        self._next_req_id += 1
-        return rid
+    def _track(self, req_id: int, mode: int, payload: object) -> None:
+        self._pending[req_id & _PENDING_MASK] = (req_id, mode, payload)
+
+    def _take(self, req_id: int) -> tuple[int, object]:
+        slot = req_id & _PENDING_MASK
+        entry = self._pending[slot]
+        if entry is None or entry[0] != req_id:
+            return _MODE_NONE, None
+        self._pending[slot] = None
+        mode, payload = entry[1], entry[2]
+        if mode == _MODE_F2_COMMIT or mode == _MODE_F2_COMMIT_LLM:
+            self._inflight.pop((mode, payload), None)
+        return mode, payload
+
+    def _find_pending(self, mode: int, payload: object) -> int | None:
+        req_id = self._inflight.get((mode, payload))
+        if req_id is None:
+            return None
+        entry = self._pending[req_id & _PENDING_MASK]
+        if entry is None or entry[0] != req_id:
+            self._inflight.pop((mode, payload), None)
+            return None
+        return req_id
+
+    def _track_unique(self, req_id: int, mode: int, payload: object) -> None:
+        self._track(req_id, mode, payload)
+        self._inflight[(mode, payload)] = req_id
+
+    def _f2_hwnd(self) -> int:
+        hwnd = self._f2_target_hwnd
+        if not hwnd:
+            hwnd = int(GetForegroundWindow() or 0)
+            self._f2_target_hwnd = hwnd
+        return hwnd
+
+    def _cache_get(self, is_zh: bool, source: str) -> str | None:
+        key = (bool(is_zh), source)
+        hit = self._xlat_cache.get(key)
+        if hit is not None:
+            self._xlat_cache.move_to_end(key)
+        return hit
+
+    def _cache_put(self, is_zh: bool, source: str, translated: str) -> None:
+        self._xlat_cache[(bool(is_zh), source)] = translated
+        if len(self._xlat_cache) > _XLAT_CACHE_MAX:
+            self._xlat_cache.popitem(last=False)
+
+    def _show_f1_result(self, anchor: QPoint, source: str, translated: str) -> None:
+        self._popup.open_f1(anchor, source, translated)
+        self._popup_close_timer.start(8000)
+        self._last_context = {"title": "F1 划词", "source": str(source or ""), "translated": str(translated or "")}
+
+    def _commit_f2(self, hwnd: int, source: str, translated: str) -> None:
+        self._set_clipboard(translated)
+        self._popup.hide()
+        self._schedule_paste(int(hwnd), translated)
+        self._last_context = {"title": "F2 打字", "source": str(source or ""), "translated": str(translated or "")}
+
+    def _set_clipboard(self, text: str) -> None:
+        if text == self._clip_text and int(GetClipboardSequenceNumber()) == self._clip_seq:
+            return
+        QApplication.clipboard().setText(text, QClipboard.Clipboard)
+        self._clip_text = text
+        self._clip_seq = int(GetClipboardSequenceNumber())
+
+    def _schedule_paste(self, hwnd: int, text: str) -> None:
+        self._paste_hwnd = int(hwnd)
+        self._paste_text = text
+        if self._paste_pending:
+            return
+        self._paste_pending = True
+        self._paste_tries = 0
+        QTimer.singleShot(30, self._run_paste)
+
+    def _run_paste(self) -> None:
+        if self._paste_tries < 20 and not _clipboard_ready():
+            self._paste_tries += 1
+            QTimer.singleShot(5, self._run_paste)
+            return
+        self._paste_pending = False
+        _refocus(self._paste_hwnd)
+        if self._paste_tries >= 20 and self._paste_text and not _clipboard_ready():
+            # Another process is still holding the clipboard; type the text instead,
+            # and fall back to the plain keybd_event paste if that is refused.
+            if not _send_text_input(self._paste_text):
+                _send_ctrl_combo_keybd(VK_V)
+            return
+        _send_ctrl_v()
 
     def _on_popup_dismissed(self) -> None:
         self._popup_close_timer.stop()
@@ -1055,60 +1425,49 @@ class AppController(QObject):
         self._busy_image = True
         self._shot_overlay.open_for_rect(rect, "Recognizing...")
         self._dismiss_hooks.enable()
-        req_id = self._alloc_req_id()
-        self._pending[req_id] = ("F3", rect)
-        self.request_image.emit(req_id, pixmap.toImage())
+        req_id = next(self._req_id_gen)
+        self._track(req_id, _MODE_F3, rect)
+        self._worker.stash_image(req_id, pixmap.toImage())
+        self.request_image.emit(req_id)
 
     @Slot(int, str)
     def _on_text_done(self, req_id: int, translated: str) -> None:
-        mode, payload = self._pending.pop(int(req_id), ("", None))
-        if mode == "F1":
+        mode, payload = self._take(int(req_id))
+        if mode == _MODE_F1:
             anchor, source, is_zh = payload
             translated = (translated or "").strip()
-            if not translated:
+            if translated:
+                self._cache_put(is_zh, source, translated)
+            else:
                 st = self._engine.status()
                 translated = (st.zh2en_error if is_zh else st.en2zh_error) or "No translation result"
-            self._popup.open_f1(anchor, source, translated)
-            self._popup_close_timer.start(8000)
-            self._last_context = {"title": "F1 划词", "source": str(source or ""), "translated": str(translated or "")}
+            self._show_f1_result(anchor, source, translated)
             return
 
-        if mode == "F1_LLM":
+        if mode == _MODE_F1_LLM:
             anchor, source = payload
             translated = (translated or "").strip() or "No translation result"
-            self._popup.open_f1(anchor, source, translated)
-            self._popup_close_timer.start(8000)
-            self._last_context = {"title": "F1 划词", "source": str(source or ""), "translated": str(translated or "")}
+            self._show_f1_result(anchor, source, translated)
             return
 
-        if mode == "F2_COMMIT":
+        if mode == _MODE_F2_COMMIT:
             hwnd, source, is_zh = payload
             translated = (translated or "").strip()
-            if not translated:
+            if translated:
+                self._cache_put(is_zh, source, translated)
+            else:
                 st = self._engine.status()
                 translated = (st.zh2en_error if is_zh else st.en2zh_error) or "No translation result"
-            QApplication.clipboard().setText(translated)
-            self._popup.hide()
-            QApplication.processEvents()
-            time.sleep(0.1)
-            _refocus(int(hwnd))
-            _send_ctrl_v()
-            self._last_context = {"title": "F2 打字", "source": str(source or ""), "translated": str(translated or "")}
+            self._commit_f2(int(hwnd), source, translated)
             return
 
-        if mode == "F2_COMMIT_LLM":
+        if mode == _MODE_F2_COMMIT_LLM:
             hwnd, source = payload
             translated = (translated or "").strip() or "No translation result"
-            QApplication.clipboard().setText(translated)
-            self._popup.hide()
-            QApplication.processEvents()
-            time.sleep(0.1)
-            _refocus(int(hwnd))
-            _send_ctrl_v()
-            self._last_context = {"title": "F2 打字", "source": str(source or ""), "translated": str(translated or "")}
+            self._commit_f2(int(hwnd), source, translated)
             return
 
-        if mode == "F2":
+        if mode == _MODE_F2:
             if self._f2_req_id != int(req_id):
                 return
             is_zh = bool(payload)
@@ -1120,7 +1479,7 @@ class AppController(QObject):
             self._last_context = {"title": "F2 打字", "source": str(self._popup.input_edit.toPlainText() or ""), "translated": str(translated or "")}
             return
 
-        if mode == "F2_LLM":
+        if mode == _MODE_F2_LLM:
             if self._f2_req_id != int(req_id):
                 return
             translated = (translated or "").strip() or "No translation result"
@@ -1128,15 +1487,15 @@ class AppController(QObject):
             self._last_context = {"title": "F2 打字", "source": str(self._popup.input_edit.toPlainText() or ""), "translated": str(translated or "")}
             return
 
-        if mode in ("DASH", "DASH_LLM"):
-            self._dashboard.set_target_text((translated or "").strip())
-            self._dashboard.show()
-            self._dashboard.raise_()
-            self._dashboard.activateWindow()
-            self._last_context = {"title": "仪表盘翻译", "source": str(self._dashboard.get_source_text() or ""), "translated": str(translated or "")}
+        if mode == _MODE_DASH or mode == _MODE_DASH_LLM:
+            self.dashboard.set_target_text((translated or "").strip())
+            self.dashboard.show()
+            self.dashboard.raise_()
+            self.dashboard.activateWindow()
+            self._last_context = {"title": "仪表盘翻译", "source": str(self.dashboard.get_source_text() or ""), "translated": str(translated or "")}
             return
 
-        if mode == "F3_LLM":
+        if mode == _MODE_F3_LLM:
             rect, source = payload
             translated = (translated or "").strip() or "No translation result"
             self._last_shot_source = (source or "").strip()
@@ -1151,9 +1510,9 @@ class AppController(QObject):
 
     @Slot(int, str, str)
     def _on_image_done(self, req_id: int, source: str, target: str) -> None:
-        mode, rect = self._pending.pop(int(req_id), ("", None))
+        mode, rect = self._take(int(req_id))
         self._busy_image = False
-        if mode != "F3":
+        if mode != _MODE_F3:
             return
 
         self._last_shot_source = (source or "").strip()
@@ -1164,12 +1523,15 @@ class AppController(QObject):
         if self._flavor == "qwen" and self._last_shot_source and not self._last_shot_target:
             self._shot_overlay.open_for_rect(rect, "翻译中...")
             self._shot_close_timer.start(16000)
-            req2 = self._alloc_req_id()
+            req2 = next(self._req_id_gen)
             use_api = False
-            target_lang = self._dashboard.get_target_language()
+            if self._dashboard is not None:
+                target_lang = self._dashboard.get_target_language()
+            else:
+                target_lang = self._store.get_target_language()
             if not target_lang or target_lang == "auto":
                 target_lang = guess_target_lang(self._last_shot_source)
-            self._pending[req2] = ("F3_LLM", (rect, self._last_shot_source))
+            self._track(req2, _MODE_F3_LLM, PendingF3Llm(rect, self._last_shot_source))
             self.request_llm_translate.emit(req2, self._last_shot_source, target_lang, bool(use_api))
             return
 
@@ -1185,54 +1547,48 @@ class AppController(QObject):
 
     @Slot(int, str)
     def _on_failed(self, req_id: int, error: str) -> None:
-        mode, _payload = self._pending.pop(int(req_id), ("", None))
+        mode, _payload = self._take(int(req_id))
         self._busy_image = False
-        if mode in ("DASH", "DASH_LLM"):
-            self._dashboard.set_target_text(error or "Error")
-            self._dashboard.show()
-            self._dashboard.raise_()
-            self._dashboard.activateWindow()
+        if mode == _MODE_DASH or mode == _MODE_DASH_LLM:
+            self.dashboard.set_target_text(error or "Error")
+            self.dashboard.show()
+            self.dashboard.raise_()
+            self.dashboard.activateWindow()
             return
-        if mode == "F3_LLM":
+        if mode == _MODE_F3_LLM:
             rect, _source = _payload
             self._shot_overlay.open_for_rect(rect, error or "Error")
             self._shot_close_timer.start(12000)
             return
-        if mode == "CHAT":
+        if mode == _MODE_CHAT:
             self._chat.append_status(f"错误：{error or ''}".strip())
             return
         self._tray.showMessage("FlashTrans", error, QSystemTrayIcon.Warning, 2500)
 
     def _open_dashboard_from_shot(self) -> None:
         self._shot_overlay.close()
-        self._dashboard.set_source_text(self._last_shot_source)
-        self._dashboard.set_target_text(self._last_shot_target)
-
-        screen = QGuiApplication.screenAt(QCursor.pos())
-        if screen is not None:
-            screen_geom = screen.availableGeometry()
-            dashboard_geom = self._dashboard.frameGeometry()
-            center_x = screen_geom.center().x() - dashboard_geom.width() // 2
-            center_y = screen_geom.center().y() - dashboard_geom.height() // 2
-            self._dashboard.move(center_x, center_y)
-
-        self._dashboard.showNormal()
-        self._dashboard.setWindowState(self._dashboard.windowState() & ~Qt.WindowMinimized | Qt.WindowActive)
-        self._dashboard.raise_()
-        self._dashboard.activateWindow()
+        self.dashboard.set_source_text(self._last_shot_source)
+        self.dashboard.set_target_text(self._last_shot_target)
+
+        self._center_on_cursor_screen(self.dashboard)
+
+        self.dashboard.showNormal()
+        self.dashboard.setWindowState(self.dashboard.windowState() & ~Qt.WindowMinimized | Qt.WindowActive)
+        self.dashboard.raise_()
+        self.dashboard.activateWindow()
 
     def _dashboard_translate(self) -> None:
-        src = (self._dashboard.get_source_text() or "").strip()
+        src = (self.dashboard.get_source_text() or "").strip()
         if not src:
             return
-        target_lang = self._dashboard.get_target_language()
+        target_lang = self.dashboard.get_target_language()
 
-        self._dashboard.set_target_text("Translating...")
-        req_id = self._alloc_req_id()
+        self.dashboard.set_target_text("Translating...")
+        req_id = next(self._req_id_gen)
         if self._flavor == "qwen":
             if target_lang == "auto":
                 target_lang = guess_target_lang(src)
-            self._pending[req_id] = ("DASH_LLM", None)
+            self._track(req_id, _MODE_DASH_LLM, None)
             self.request_llm_translate.emit(req_id, src, target_lang, False)
             return
 
@@ -1249,7 +1605,7 @@ class AppController(QObject):
             }
 
             def guess_src_lang(text: str) -> str:
-                if re.search(r"[\u4e00-\u9fff]", text):
+                if _has_cjk(text):
                     return "zho_Hans"
                 if re.search(r"[\u3040-\u30ff]", text):
                     return "jpn_Jpan"
@@ -1265,76 +1621,96 @@ class AppController(QObject):
             else:
                 tgt_lang = tgt_map.get(target_lang, "")
                 if not tgt_lang:
-                    self._dashboard.set_target_text("该目标语言当前未配置")
+                    self.dashboard.set_target_text("该目标语言当前未配置")
                     return
             if tgt_lang == src_lang:
-                self._dashboard.set_target_text(src)
+                self.dashboard.set_target_text(src)
                 return
-            self._pending[req_id] = ("DASH", None)
+            self._track(req_id, _MODE_DASH, None)
             self.request_text_nllb.emit(req_id, src, src_lang, tgt_lang)
             return
 
         if target_lang not in ("auto", "zh", "en"):
-            self._dashboard.set_target_text("该目标语言需要使用其他版本")
+            self.dashboard.set_target_text("该目标语言需要使用其他版本")
             return
 
-        is_zh = bool(re.search(r"[\u4e00-\u9fff]", src))
+        is_zh = _has_cjk(src)
         if target_lang == "auto":
             target_lang = "en" if is_zh else "zh"
-        self._pending[req_id] = ("DASH", None)
+        self._track(req_id, _MODE_DASH, None)
         if target_lang == "en":
             if is_zh:
-                self.request_text_zh2en.emit(req_id, src)
+                self.request_text_zh2en.emit(req_id, src, _BEAM_DASHBOARD)
             else:
-                self._dashboard.set_target_text(src)
+                self.dashboard.set_target_text(src)
         else:
             if is_zh:
-                self._dashboard.set_target_text(src)
+                self.dashboard.set_target_text(src)
             else:
-                self.request_text_en2zh.emit(req_id, src)
+                self.request_text_en2zh.emit(req_id, src, _BEAM_DASHBOARD)
 
     def _on_f2_confirmed(self, text: str) -> None:
         src = (text or "").strip()
         if not src:
             return
-        hwnd = int(self._f2_target_hwnd or GetForegroundWindow())
+        hwnd = self._f2_hwnd()
+        is_zh = _has_cjk(src)
+        if self._flavor != "qwen":
+            cached = self._cache_get(is_zh, src)
+            if cached is not None:
+                self._commit_f2(hwnd, src, cached)
+                return
+        if self._flavor == "qwen":
+            mode, payload = _MODE_F2_COMMIT_LLM, PendingF2CommitLlm(hwnd, src)
+        else:
+            mode, payload = _MODE_F2_COMMIT, PendingF2Commit(hwnd, src, is_zh)
+        if self._find_pending(mode, payload) is not None:
+            return
         self._popup.set_f2_translating()
-        req_id = self._alloc_req_id()
-        is_zh = bool(re.search(r"[\u4e00-\u9fff]", src))
+        req_id = next(self._req_id_gen)
+        self._track_unique(req_id, mode, payload)
         if self._flavor == "qwen":
             target_lang = "en" if is_zh else "zh"
             use_api = False
-            self._pending[req_id] = ("F2_COMMIT_LLM", (hwnd, src))
             self.request_llm_translate.emit(req_id, src, target_lang, bool(use_api))
+        elif is_zh:
+            self.request_text_zh2en.emit(req_id, src, _BEAM_INTERACTIVE)
         else:
-            self._pending[req_id] = ("F2_COMMIT", (hwnd, src, is_zh))
-            if is_zh:
-                self.request_text_zh2en.emit(req_id, src)
-            else:
-                self.request_text_en2zh.emit(req_id, src)
+            self.request_text_en2zh.emit(req_id, src, _BEAM_INTERACTIVE)
 
     def _on_f2_canceled_with_paste(self, text: str) -> None:
         src = (text or "").strip()
         if not src:
             self._popup.hide()
             return
-        hwnd = int(self._f2_target_hwnd or GetForegroundWindow())
-        QApplication.clipboard().setText(src)
+        hwnd = self._f2_hwnd()
+        self._set_clipboard(src)
         self._popup.hide()
-        QApplication.processEvents()
-        time.sleep(0.1)
-        _refocus(hwnd)
-        _send_ctrl_v()
+        self._schedule_paste(hwnd, src)
 
     def _dashboard_copy_source(self) -> None:
-        QApplication.clipboard().setText(self._dashboard.get_source_text() or "")
+        if self._dashboard is None:
+            return
+        doc = self._dashboard.source_edit.document()
+        if doc.isEmpty():
+            return
+        self._set_clipboard(doc.toPlainText())
 
     def _dashboard_copy_target(self) -> None:
-        QApplication.clipboard().setText(self._dashboard.target_edit.toPlainText() or "")
+        if self._dashboard is None:
+            return
+        doc = self._dashboard.target_edit.document()
+        if doc.isEmpty():
+            return
+        self._set_clipboard(doc.toPlainText())
 
     def _dashboard_clear(self) -> None:
-        self._dashboard.set_source_text("")
-        self._dashboard.set_target_text("")
+        if self._dashboard is None:
+            return
+        if not self._dashboard.source_edit.document().isEmpty():
+            self._dashboard.set_source_text("")
+        if not self._dashboard.target_edit.document().isEmpty():
+            self._dashboard.set_target_text("")
 
     def _sync_llm_settings(self) -> None:
         p = self._store.get_profile()
@@ -1364,8 +1740,8 @@ class AppController(QObject):
 
         self._chat.append_user(q)
         self._chat.append_status("助手思考中...")
-        req_id = self._alloc_req_id()
-        self._pending[req_id] = ("CHAT", None)
+        req_id = next(self._req_id_gen)
+        self._track(req_id, _MODE_CHAT, None)
         worker_payload = {
             "question": q,
             "context": ctx,
@@ -1375,7 +1751,7 @@ class AppController(QObject):
 
     @Slot(int, str)
     def _on_chat_done(self, req_id: int, answer: str) -> None:
-        self._pending.pop(int(req_id), None)
+        self._take(int(req_id))
         self._chat.append_assistant(answer or "")
 
     def _on_chat_dismissed(self) -> None:
@@ -1434,12 +1810,15 @@ def main() -> int:
     tray.show()
 
     overlay = SnippingOverlay()
+    compute_type = os.environ.get("FLASHTRANS_COMPUTE_TYPE", "") or "auto"
     if flavor == "nllb":
-        engine = CoreEngine(mt_backend="nllb", nllb_model_dir=nllb_dir)
+        engine = CoreEngine(mt_backend="nllb", nllb_model_dir=nllb_dir, compute_type=compute_type)
     elif flavor == "qwen":
         engine = CoreEngine(mt_backend="none")
     else:
-        engine = CoreEngine(model_dir_en2zh=model_dir_en2zh, model_dir_zh2en=model_dir_zh2en)
+        engine = CoreEngine(
+            model_dir_en2zh=model_dir_en2zh, model_dir_zh2en=model_dir_zh2en, compute_type=compute_type
+        )
     st = engine.status()
     if flavor in ("opus", "nllb") and ((not st.en2zh_ready) or (not st.zh2en_ready)):
         details = []
@@ -1516,37 +1895,47 @@ def main() -> int:
         if not all(results.values()):
             tray.showMessage("FlashTrans", "全局热键注册失败：可能被其他程序占用。", QSystemTrayIcon.Warning, 2500)
 
-    dashboard = DashboardWindow(on_hotkeys_changed=_apply_hotkeys)
-    dashboard.hide()
     controller = AppController(
         tray,
         overlay,
         engine,
-        dashboard,
+        lambda: DashboardWindow(on_hotkeys_changed=_apply_hotkeys),
         flavor=flavor,
         qwen_model_path=qwen_model_path if flavor == "qwen" else None,
     )
 
     _apply_hotkeys()
-
-    hotkeys.hotkey_pressed.connect(
-        lambda hid: controller.on_hotkey_f1()
-        if hid == 1
-        else controller.on_hotkey_f2()
-        if hid == 2
-        else controller.on_hotkey_f3()
-        if hid == 3
-        else controller.on_hotkey_f4()
-        if hid == 4
-        else controller.on_hotkey_f5()
-        if hid == 5
-        else None
-    )
-
-    act_dashboard.triggered.connect(lambda: (dashboard.show(), dashboard.raise_(), dashboard.activateWindow()))
+    QTimer.singleShot(50, controller.request_warmup.emit)
+    hotkeys.clipboard_updated.connect(controller.on_clipboard_updated)
+    if not hotkeys.start_clipboard_listener():
+        controller.enable_f1_clipboard_poll()
+
+    hk_dispatch = {
+        1: controller.on_hotkey_f1,
+        2: controller.on_hotkey_f2,
+        3: controller.on_hotkey_f3,
+        4: controller.on_hotkey_f4,
+        5: controller.on_hotkey_f5,
+    }
+
+    def _on_hotkey(hid: int) -> None:
+        handler = hk_dispatch.get(int(hid))
+        if handler is not None:
+            handler()
+
+    hotkeys.hotkey_pressed.connect(_on_hotkey)
+
+    def _show_dashboard() -> None:
+        d = controller.dashboard
+        d.show()
+        d.raise_()
+        d.activateWindow()
+
+    act_dashboard.triggered.connect(_show_dashboard)
     act_exit.triggered.connect(app.quit)
 
     def _cleanup() -> None:
+        hotkeys.stop_clipboard_listener()
         hotkeys.unregister_all()
         controller.shutdown()
 
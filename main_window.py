@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Callable
 
-from PySide6.QtCore import Qt, QPoint, Signal, QObject, QEvent
+from PySide6.QtCore import Qt, QPoint, Signal
+from PySide6.QtGui import QKeySequence, QShortcut, QStandardItem
 from PySide6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -30,15 +33,15 @@ MOD_SHIFT = 0x0004
 MOD_WIN = 0x0008
 
 
-def _vk_to_key_name(vk: int) -> str:
-    vk = int(vk)
-    if 0x70 <= vk <= 0x87:
-        return f"F{vk - 0x6F}"
-    if 0x30 <= vk <= 0x39:
-        return chr(vk)
-    if 0x41 <= vk <= 0x5A:
-        return chr(vk)
-    names = {
+_VK_NAME: dict[int, str] = {}
+for _vk in range(0x70, 0x88):
+    _VK_NAME[_vk] = f"F{_vk - 0x6F}"
+for _vk in range(0x30, 0x3A):
+    _VK_NAME[_vk] = chr(_vk)
+for _vk in range(0x41, 0x5B):
+    _VK_NAME[_vk] = chr(_vk)
+_VK_NAME.update(
+    {
         0x20: "Space",
         0x09: "Tab",
         0x1B: "Esc",
@@ -50,33 +53,35 @@ def _vk_to_key_name(vk: int) -> str:
         0x27: "Right",
         0x28: "Down",
     }
-    return names.get(vk, f"VK_{vk}")
+)
+del _vk
 
+_MOD_PARTS = ((MOD_CONTROL, "Ctrl"), (MOD_ALT, "Alt"), (MOD_SHIFT, "Shift"), (MOD_WIN, "Win"))
 
+
+def _vk_to_key_name(vk: int) -> str:
+    vk = int(vk)
+    return _VK_NAME.get(vk, f"VK_{vk}")
+
+
+@lru_cache(maxsize=256)
 def _format_hotkey(mods: int, vk: int) -> str:
-    parts: list[str] = []
     mods = int(mods)
-    if mods & MOD_CONTROL:
-        parts.append("Ctrl")
-    if mods & MOD_ALT:
-        parts.append("Alt")
-    if mods & MOD_SHIFT:
-        parts.append("Shift")
-    if mods & MOD_WIN:
-        parts.append("Win")
-    parts.append(_vk_to_key_name(int(vk)))
+    parts = [name for bit, name in _MOD_PARTS if mods & bit]
+    parts.append(_vk_to_key_name(vk))
     return "+".join(parts)
 
 
 class _HotkeyEdit(QLineEdit):
     changed = Signal()
 
-    def __init__(self, parent: QWidget | None = None) -> None:
+    def __init__(self, parent: QWidget | None = None, placeholder: str = "") -> None:
         super().__init__(parent)
         self._vk = 0
         self._mods = 0
         self.setReadOnly(True)
-        self.setPlaceholderText("点击后按组合键" if QApplication.instance().property("ui_lang") != "en" else "Click and press keys")
+        if placeholder:
+            self.setPlaceholderText(placeholder)
 
     def set_hotkey(self, mods: int, vk: int) -> None:
         self._mods = int(mods)
@@ -116,9 +121,6 @@ QWidget {
     font-family: "Microsoft YaHei UI";
     font-size: 12px;
 }
-#TitleBar {
-    background: #0f1114;
-}
 QPushButton {
     background: #1e2228;
     border: 1px solid #2a2f37;
@@ -138,30 +140,6 @@ QTextEdit {
     padding: 10px;
     selection-background-color: #2b6cb0;
 }
-QLabel#AppTitle {
-    font-size: 14px;
-    font-weight: 600;
-}
-QPushButton#WindowButton {
-    min-width: 34px;
-    max-width: 34px;
-    min-height: 26px;
-    max-height: 26px;
-    border-radius: 6px;
-    padding: 0px;
-}
-QPushButton#CloseButton {
-    min-width: 34px;
-    max-width: 34px;
-    min-height: 26px;
-    max-height: 26px;
-    border-radius: 6px;
-    padding: 0px;
-}
-QPushButton#CloseButton:hover {
-    background: #b42318;
-    border-color: #b42318;
-}
 """
 
 
@@ -172,9 +150,6 @@ QWidget {
     font-family: "Microsoft YaHei UI";
     font-size: 12px;
 }
-#TitleBar {
-    background: #ffffff;
-}
 QPushButton {
     background: #ffffff;
     border: 1px solid #d7dbe5;
@@ -194,6 +169,24 @@ QTextEdit {
     padding: 10px;
     selection-background-color: #2b6cb0;
 }
+"""
+
+
+_QSS_TITLEBAR_DARK = """
+#TitleBar {
+    background: #0f1114;
+}
+QLabel#AppTitle {
+    font-size: 14px;
+    font-weight: 600;
+}
+"""
+
+
+_QSS_TITLEBAR_LIGHT = """
+#TitleBar {
+    background: #ffffff;
+}
 QLabel#AppTitle {
     font-size: 14px;
     font-weight: 600;
@@ -201,7 +194,11 @@ QLabel#AppTitle {
 QLabel#BackendLabel {
     color: #6b7280;
 }
-QPushButton#WindowButton {
+"""
+
+
+_QSS_WINBTN = """
+QPushButton {
     min-width: 34px;
     max-width: 34px;
     min-height: 26px;
@@ -209,15 +206,19 @@ QPushButton#WindowButton {
     border-radius: 6px;
     padding: 0px;
 }
-QPushButton#CloseButton {
-    min-width: 34px;
-    max-width: 34px;
-    min-height: 26px;
-    max-height: 26px;
-    border-radius: 6px;
-    padding: 0px;
+"""
+
+
+_QSS_CLOSEBTN_DARK = _QSS_WINBTN + """
+QPushButton:hover {
+    background: #b42318;
+    border-color: #b42318;
 }
-QPushButton#CloseButton:hover {
+"""
+
+
+_QSS_CLOSEBTN_LIGHT = _QSS_WINBTN + """
+QPushButton:hover {
     background: #d92d20;
     border-color: #d92d20;
     color: #ffffff;
@@ -225,15 +226,136 @@ QPushButton#CloseButton:hover {
 """
 
 
-class _SourceEditFilter(QObject):
-    ctrl_enter = Signal()
+_QSS_CACHE = {"dark": _QSS_DARK, "light": _QSS_LIGHT}
+_QSS_TITLEBAR = {"dark": _QSS_TITLEBAR_DARK, "light": _QSS_TITLEBAR_LIGHT}
+_QSS_CLOSEBTN = {"dark": _QSS_CLOSEBTN_DARK, "light": _QSS_CLOSEBTN_LIGHT}
+
+
+_I18N_ZH = MappingProxyType(
+    {
+        "dashboard_title": "FlashTrans 仪表盘",
+        "translate": "翻译",
+        "copy_source": "复制原文",
+        "copy_target": "复制译文",
+        "clear": "清空",
+        "settings": "设置",
+        "theme": "主题",
+        "lang_auto": "目标语言：自动",
+        "lang_zh": "目标语言：中文",
+        "lang_en": "目标语言：英文",
+        "lang_ja": "目标语言：日文",
+        "lang_ko": "目标语言：韩文",
+        "lang_fr": "目标语言：法文",
+        "lang_de": "目标语言：德文",
+        "lang_es": "目标语言：西班牙文",
+        "lang_ru": "目标语言：俄文",
+        "tip_translate": "将左侧原文翻译到右侧（快捷键：Ctrl+Enter）",
+        "tip_copy_source": "复制左侧识别结果",
+        "tip_copy_target": "复制右侧翻译结果",
+        "tip_clear": "清空原文和译文",
+        "tip_settings": "配置 API / 界面语言 / 交互功能",
+        "tip_theme": "切换主题（暗色/亮色）",
+        "source_placeholder": "原文（可编辑，支持手动翻译）",
+        "target_placeholder": "译文（翻译结果）",
+        "dlg_title": "设置",
+        "ui_lang": "界面语言",
+        "ui_zh": "中文",
+        "ui_en": "English",
+        "llm_enable": "启用 F4 大模型交互（使用 API）",
+        "backend": "翻译后端",
+        "backend_offline": "离线（当前内置模型）",
+        "backend_api": "API（用大模型翻译）",
+        "api_profile": "配置名称",
+        "api_base": "API Base URL",
+        "api_model": "Model",
+        "api_key": "API Key",
+        "save": "保存",
+        "delete": "删除",
+        "ok": "确定",
+    }
+)
+
+
+_I18N_EN = MappingProxyType(
+    {
+        "dashboard_title": "FlashTrans Dashboard",
+        "translate": "Translate",
+        "copy_source": "Copy Source",
+        "copy_target": "Copy Target",
+        "clear": "Clear",
+        "settings": "Settings",
+        "theme": "Theme",
+        "lang_auto": "Target: Auto",
+        "lang_zh": "Target: Chinese",
+        "lang_en": "Target: English",
+        "lang_ja": "Target: Japanese",
+        "lang_ko": "Target: Korean",
+        "lang_fr": "Target: French",
+        "lang_de": "Target: German",
+        "lang_es": "Target: Spanish",
+        "lang_ru": "Target: Russian",
+        "tip_translate": "Translate left text to the right (Ctrl+Enter)",
+        "tip_copy_source": "Copy source text",
+        "tip_copy_target": "Copy translated text",
+        "tip_clear": "Clear both panes",
+        "tip_settings": "Configure API / UI language / interactions",
+        "tip_theme": "Toggle theme",
+        "source_placeholder": "Source text (editable)",
+        "target_placeholder": "Translation result",
+        "dlg_title": "Settings",
+        "ui_lang": "UI Language",
+        "ui_zh": "中文",
+        "ui_en": "English",
+        "llm_enable": "Enable F4 LLM (via API)",
+        "backend": "Translation Backend",
+        "backend_offline": "Offline (built-in)",
+        "backend_api": "API (LLM translation)",
+        "api_profile": "Profile Name",
+        "api_base": "API Base URL",
+        "api_model": "Model",
+        "api_key": "API Key",
+        "save": "Save",
+        "delete": "Delete",
+        "ok": "OK",
+    }
+)
+
+
+_GETTERS = {
+    "setText": "text",
+    "setToolTip": "toolTip",
+    "setPlaceholderText": "placeholderText",
+    "setWindowTitle": "windowTitle",
+}
+
+
+def _set_if_changed(w: QWidget, setter: str, value: str) -> None:
+    if getattr(w, _GETTERS[setter])() != value:
+        getattr(w, setter)(value)
 
-    def eventFilter(self, obj, event):  # type: ignore[override]
-        if event.type() == QEvent.KeyPress:
-            if event.key() in (Qt.Key_Return, Qt.Key_Enter) and (event.modifiers() & Qt.ControlModifier):
-                self.ctrl_enter.emit()
-                return True
-        return False
+
+def _add_combo_item(combo: QComboBox, label: str, data: str) -> None:
+    index = getattr(combo, "_data_index", None)
+    if index is None:
+        index = combo._data_index = {}
+    index[str(data)] = combo.count()
+    combo.addItem(label, data)
+
+
+def _clear_combo(combo: QComboBox) -> None:
+    combo._data_index = {}
+    combo.clear()
+
+
+_DEFAULT_HK = (("f1", 0, 0x70), ("f2", 0, 0x71), ("f3", 0, 0x72), ("f4", 0, 0x73), ("f5", 0, 0x74))
+_HK_LABELS_ZH = MappingProxyType({"f1": "F1 划词", "f2": "F2 打字", "f3": "F3 截图", "f4": "F4 对话", "f5": "F5 仪表盘"})
+_HK_LABELS_EN = MappingProxyType(
+    {"f1": "F1 Hover", "f2": "F2 Type", "f3": "F3 Screenshot", "f4": "F4 Chat", "f5": "F5 Dashboard"}
+)
+
+
+_LANG_CODES = ("auto", "zh", "en", "ja", "ko", "fr", "de", "es", "ru")
+_LANG_INDEX = {c: i for i, c in enumerate(_LANG_CODES)}
 
 
 class DashboardWindow(QWidget):
@@ -247,6 +369,7 @@ class DashboardWindow(QWidget):
         self._store = SettingsStore()
         self._on_hotkeys_changed = on_hotkeys_changed
         self._ui_lang = self._store.get_ui_language()
+        self._i18n = _I18N_EN if self._ui_lang == "en" else _I18N_ZH
         self.setWindowTitle(self._t("dashboard_title"))
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Window | Qt.WindowStaysOnTopHint)
         self.setMinimumSize(760, 420)
@@ -254,6 +377,7 @@ class DashboardWindow(QWidget):
         self._theme = "dark"
         self._drag_active = False
         self._drag_offset = QPoint()
+        self._settings_dialog: _SettingsDialog | None = None
 
         self._build_ui()
         self.apply_theme(self._theme)
@@ -271,8 +395,12 @@ class DashboardWindow(QWidget):
         theme = theme.lower().strip()
         if theme not in ("dark", "light"):
             theme = "dark"
+        if theme == self._theme and self.styleSheet():
+            return
         self._theme = theme
-        self.setStyleSheet(_QSS_DARK if theme == "dark" else _QSS_LIGHT)
+        self.setStyleSheet(_QSS_CACHE[theme])
+        self._title_bar.setStyleSheet(_QSS_TITLEBAR[theme])
+        self._btn_close.setStyleSheet(_QSS_CLOSEBTN[theme])
 
     def toggle_theme(self) -> None:
         self.apply_theme("light" if self._theme == "dark" else "dark")
@@ -281,13 +409,24 @@ class DashboardWindow(QWidget):
         self._source_edit.setPlainText(text or "")
 
     def set_target_text(self, text: str) -> None:
-        self._target_edit.setPlainText(text or "")
+        edit = self._target_edit
+        edit.setUpdatesEnabled(False)
+        try:
+            edit.clear()
+            if text:
+                edit.textCursor().insertText(text)
+        finally:
+            edit.setUpdatesEnabled(True)
 
     def get_source_text(self) -> str:
         return self._source_edit.toPlainText() or ""
 
     def mousePressEvent(self, event) -> None:  # type: ignore[override]
         if event.button() == Qt.LeftButton and self._is_in_title_bar(event.position().toPoint()):
+            handle = self.windowHandle()
+            if handle is not None and handle.startSystemMove():
+                event.accept()
+                return
             self._drag_active = True
             self._drag_offset = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
             event.accept()
@@ -306,8 +445,12 @@ class DashboardWindow(QWidget):
             self._drag_active = False
         super().mouseReleaseEvent(event)
 
+    def resizeEvent(self, event) -> None:  # type: ignore[override]
+        super().resizeEvent(event)
+        self._title_bar_height = self._title_bar.height()
+
     def _is_in_title_bar(self, pos: QPoint) -> bool:
-        return pos.y() <= self._title_bar.height()
+        return pos.y() <= self._title_bar_height
 
     def _build_ui(self) -> None:
         root = QVBoxLayout(self)
@@ -338,10 +481,12 @@ class DashboardWindow(QWidget):
         btn_min = QPushButton("-", self._title_bar)
         btn_min.setObjectName("WindowButton")
         btn_min.setAccessibleName("最小化")
+        btn_min.setStyleSheet(_QSS_WINBTN)
 
         btn_close = QPushButton("×", self._title_bar)
         btn_close.setObjectName("CloseButton")
         btn_close.setAccessibleName("关闭")
+        self._btn_close = btn_close
 
         btn_min.clicked.connect(self.showMinimized)
         btn_close.clicked.connect(self.close)
@@ -350,6 +495,7 @@ class DashboardWindow(QWidget):
         title_layout.addWidget(btn_close)
 
         root.addWidget(self._title_bar)
+        self._title_bar_height = self._title_bar.height()
 
         toolbar = QWidget(self)
         toolbar_layout = QHBoxLayout(toolbar)
@@ -364,16 +510,7 @@ class DashboardWindow(QWidget):
         self._btn_settings = QPushButton(self._t("settings"), toolbar)
 
         self._target_lang = QComboBox(toolbar)
-        self._target_lang.addItem(self._t("lang_auto"), "auto")
-        self._target_lang.addItem(self._t("lang_zh"), "zh")
-        self._target_lang.addItem(self._t("lang_en"), "en")
-        self._target_lang.addItem(self._t("lang_ja"), "ja")
-        self._target_lang.addItem(self._t("lang_ko"), "ko")
-        self._target_lang.addItem(self._t("lang_fr"), "fr")
-        self._target_lang.addItem(self._t("lang_de"), "de")
-        self._target_lang.addItem(self._t("lang_es"), "es")
-        self._target_lang.addItem(self._t("lang_ru"), "ru")
-        self._set_combo_by_data(self._target_lang, self._store.get_target_language())
+        self._fill_target_lang(self._store.get_target_language())
 
         self._btn_translate.setToolTip(self._t("tip_translate"))
         self._btn_copy_src.setToolTip(self._t("tip_copy_source"))
@@ -389,7 +526,7 @@ class DashboardWindow(QWidget):
         self._btn_theme.clicked.connect(self.toggle_theme)
         self._btn_settings.clicked.connect(self._open_settings_dialog)
 
-        self._target_lang.currentIndexChanged.connect(lambda: self._store.set_target_language(self.get_target_language()))
+        self._target_lang.currentIndexChanged.connect(self._on_target_lang_changed)
 
         toolbar_layout.addWidget(self._btn_translate)
         toolbar_layout.addWidget(self._btn_copy_src)
@@ -420,9 +557,10 @@ class DashboardWindow(QWidget):
 
         root.addWidget(splitter, 1)
 
-        self._source_filter = _SourceEditFilter(self)
-        self._source_filter.ctrl_enter.connect(self.translate_requested.emit)
-        self._source_edit.installEventFilter(self._source_filter)
+        for key in (Qt.Key_Return, Qt.Key_Enter):
+            sc = QShortcut(QKeySequence(Qt.CTRL | key), self._source_edit)
+            sc.setContext(Qt.WidgetWithChildrenShortcut)
+            sc.activated.connect(self.translate_requested.emit)
 
     def get_target_language(self) -> str:
         try:
@@ -440,134 +578,57 @@ class DashboardWindow(QWidget):
         self._backend_label.setText(str(text or "").strip())
 
     def _t(self, key: str) -> str:
-        zh = {
-            "dashboard_title": "FlashTrans 仪表盘",
-            "translate": "翻译",
-            "copy_source": "复制原文",
-            "copy_target": "复制译文",
-            "clear": "清空",
-            "settings": "设置",
-            "theme": "主题",
-            "lang_auto": "目标语言：自动",
-            "lang_zh": "目标语言：中文",
-            "lang_en": "目标语言：英文",
-            "lang_ja": "目标语言：日文",
-            "lang_ko": "目标语言：韩文",
-            "lang_fr": "目标语言：法文",
-            "lang_de": "目标语言：德文",
-            "lang_es": "目标语言：西班牙文",
-            "lang_ru": "目标语言：俄文",
-            "tip_translate": "将左侧原文翻译到右侧（快捷键：Ctrl+Enter）",
-            "tip_copy_source": "复制左侧识别结果",
-            "tip_copy_target": "复制右侧翻译结果",
-            "tip_clear": "清空原文和译文",
-            "tip_settings": "配置 API / 界面语言 / 交互功能",
-            "tip_theme": "切换主题（暗色/亮色）",
-            "source_placeholder": "原文（可编辑，支持手动翻译）",
-            "target_placeholder": "译文（翻译结果）",
-            "dlg_title": "设置",
-            "ui_lang": "界面语言",
-            "ui_zh": "中文",
-            "ui_en": "English",
-            "llm_enable": "启用 F4 大模型交互（使用 API）",
-            "backend": "翻译后端",
-            "backend_offline": "离线（当前内置模型）",
-            "backend_api": "API（用大模型翻译）",
-            "api_profile": "配置名称",
-            "api_base": "API Base URL",
-            "api_model": "Model",
-            "api_key": "API Key",
-            "save": "保存",
-            "delete": "删除",
-            "ok": "确定",
-        }
-        en = {
-            "dashboard_title": "FlashTrans Dashboard",
-            "translate": "Translate",
-            "copy_source": "Copy Source",
-            "copy_target": "Copy Target",
-            "clear": "Clear",
-            "settings": "Settings",
-            "theme": "Theme",
-            "lang_auto": "Target: Auto",
-            "lang_zh": "Target: Chinese",
-            "lang_en": "Target: English",
-            "lang_ja": "Target: Japanese",
-            "lang_ko": "Target: Korean",
-            "lang_fr": "Target: French",
-            "lang_de": "Target: German",
-            "lang_es": "Target: Spanish",
-            "lang_ru": "Target: Russian",
-            "tip_translate": "Translate left text to the right (Ctrl+Enter)",
-            "tip_copy_source": "Copy source text",
-            "tip_copy_target": "Copy translated text",
-            "tip_clear": "Clear both panes",
-            "tip_settings": "Configure API / UI language / interactions",
-            "tip_theme": "Toggle theme",
-            "source_placeholder": "Source text (editable)",
-            "target_placeholder": "Translation result",
-            "dlg_title": "Settings",
-            "ui_lang": "UI Language",
-            "ui_zh": "中文",
-            "ui_en": "English",
-            "llm_enable": "Enable F4 LLM (via API)",
-            "backend": "Translation Backend",
-            "backend_offline": "Offline (built-in)",
-            "backend_api": "API (LLM translation)",
-            "api_profile": "Profile Name",
-            "api_base": "API Base URL",
-            "api_model": "Model",
-            "api_key": "API Key",
-            "save": "Save",
-            "delete": "Delete",
-            "ok": "OK",
-        }
-        return (en if self._ui_lang == "en" else zh).get(key, key)
+        return self._i18n.get(key, key)
 
     def _apply_ui_language(self) -> None:
-        self.setWindowTitle(self._t("dashboard_title"))
-        self._title.setText(self._t("dashboard_title"))
-        self._btn_translate.setText(self._t("translate"))
-        self._btn_copy_src.setText(self._t("copy_source"))
-        self._btn_copy_tgt.setText(self._t("copy_target"))
-        self._btn_clear.setText(self._t("clear"))
-        self._btn_theme.setText(self._t("theme"))
-        self._btn_settings.setText(self._t("settings"))
-
-        self._btn_translate.setToolTip(self._t("tip_translate"))
-        self._btn_copy_src.setToolTip(self._t("tip_copy_source"))
-        self._btn_copy_tgt.setToolTip(self._t("tip_copy_target"))
-        self._btn_clear.setToolTip(self._t("tip_clear"))
-        self._btn_theme.setToolTip(self._t("tip_theme"))
-        self._btn_settings.setToolTip(self._t("tip_settings"))
-
-        self._source_edit.setPlaceholderText(self._t("source_placeholder"))
-        self._target_edit.setPlaceholderText(self._t("target_placeholder"))
-        cur = self.get_target_language()
-        self._target_lang.blockSignals(True)
-        self._target_lang.clear()
-        self._target_lang.addItem(self._t("lang_auto"), "auto")
-        self._target_lang.addItem(self._t("lang_zh"), "zh")
-        self._target_lang.addItem(self._t("lang_en"), "en")
-        self._target_lang.addItem(self._t("lang_ja"), "ja")
-        self._target_lang.addItem(self._t("lang_ko"), "ko")
-        self._target_lang.addItem(self._t("lang_fr"), "fr")
-        self._target_lang.addItem(self._t("lang_de"), "de")
-        self._target_lang.addItem(self._t("lang_es"), "es")
-        self._target_lang.addItem(self._t("lang_ru"), "ru")
-        self._set_combo_by_data(self._target_lang, cur)
-        self._target_lang.blockSignals(False)
-
-    def _set_combo_by_data(self, combo: QComboBox, value: str) -> None:
-        value = str(value or "")
-        for i in range(combo.count()):
-            if str(combo.itemData(i)) == value:
-                combo.setCurrentIndex(i)
-                return
-        combo.setCurrentIndex(0)
+        self._i18n = _I18N_EN if self._ui_lang == "en" else _I18N_ZH
+        _set_if_changed(self, "setWindowTitle", self._t("dashboard_title"))
+        _set_if_changed(self._title, "setText", self._t("dashboard_title"))
+        _set_if_changed(self._btn_translate, "setText", self._t("translate"))
+        _set_if_changed(self._btn_copy_src, "setText", self._t("copy_source"))
+        _set_if_changed(self._btn_copy_tgt, "setText", self._t("copy_target"))
+        _set_if_changed(self._btn_clear, "setText", self._t("clear"))
+        _set_if_changed(self._btn_theme, "setText", self._t("theme"))
+        _set_if_changed(self._btn_settings, "setText", self._t("settings"))
+
+        _set_if_changed(self._btn_translate, "setToolTip", self._t("tip_translate"))
+        _set_if_changed(self._btn_copy_src, "setToolTip", self._t("tip_copy_source"))
+        _set_if_changed(self._btn_copy_tgt, "setToolTip", self._t("tip_copy_target"))
+        _set_if_changed(self._btn_clear, "setToolTip", self._t("tip_clear"))
+        _set_if_changed(self._btn_theme, "setToolTip", self._t("tip_theme"))
+        _set_if_changed(self._btn_settings, "setToolTip", self._t("tip_settings"))
+
+        _set_if_changed(self._source_edit, "setPlaceholderText", self._t("source_placeholder"))
+        _set_if_changed(self._target_edit, "setPlaceholderText", self._t("target_placeholder"))
+        if self._target_lang.itemText(0) != self._t("lang_auto"):
+            self._fill_target_lang(self.get_target_language())
+
+    def _on_target_lang_changed(self) -> None:
+        self._store.set_target_language(self.get_target_language())
+
+    def _fill_target_lang(self, code: str) -> None:
+        combo = self._target_lang
+        combo.blockSignals(True)
+        model = combo.model()
+        model.clear()
+        items: list[QStandardItem] = []
+        for c in _LANG_CODES:
+            it = QStandardItem(self._t(f"lang_{c}"))
+            it.setData(c, Qt.UserRole)
+            items.append(it)
+        model.invisibleRootItem().appendRows(items)
+        combo.setCurrentIndex(_LANG_INDEX.get(str(code or ""), 0))
+        combo.blockSignals(False)
 
     def _open_settings_dialog(self) -> None:
-        dlg = _SettingsDialog(self._store, self._ui_lang, self, on_hotkeys_changed=self._on_hotkeys_changed)
+        dlg = self._settings_dialog
+        if dlg is None or dlg.ui_lang != self._ui_lang:
+            if dlg is not None:
+                dlg.deleteLater()
+            dlg = _SettingsDialog(self._store, self._ui_lang, self, on_hotkeys_changed=self._on_hotkeys_changed)
+            self._settings_dialog = dlg
+        else:
+            dlg.refresh()
         if dlg.exec() == QDialog.Accepted:
             self._ui_lang = self._store.get_ui_language()
             self._apply_ui_language()
@@ -588,11 +649,6 @@ class _SettingsDialog(QDialog):
         self.setWindowTitle("设置" if self._ui_lang != "en" else "Settings")
         self.setModal(True)
         self.resize(560, 520)
-        if parent is not None:
-            try:
-                self.setStyleSheet(parent.styleSheet())
-            except Exception:
-                pass
 
         root = QVBoxLayout(self)
         form = QFormLayout()
@@ -600,8 +656,8 @@ class _SettingsDialog(QDialog):
         root.addLayout(form)
 
         self._lang_combo = QComboBox(self)
-        self._lang_combo.addItem("中文", "zh-CN")
-        self._lang_combo.addItem("English", "en")
+        _add_combo_item(self._lang_combo, "中文", "zh-CN")
+        _add_combo_item(self._lang_combo, "English", "en")
         self._set_combo_by_data(self._lang_combo, self._store.get_ui_language())
         form.addRow("界面语言" if self._ui_lang != "en" else "UI Language", self._lang_combo)
 
@@ -617,17 +673,23 @@ class _SettingsDialog(QDialog):
         hotkey_layout = QFormLayout(hotkey_box)
         hotkey_layout.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
 
-        self._hk_f1 = _HotkeyEdit(hotkey_box)
-        self._hk_f2 = _HotkeyEdit(hotkey_box)
-        self._hk_f3 = _HotkeyEdit(hotkey_box)
-        self._hk_f4 = _HotkeyEdit(hotkey_box)
-        self._hk_f5 = _HotkeyEdit(hotkey_box)
-
-        hotkey_layout.addRow("F1 划词" if self._ui_lang != "en" else "F1 Hover", self._hk_f1)
-        hotkey_layout.addRow("F2 打字" if self._ui_lang != "en" else "F2 Type", self._hk_f2)
-        hotkey_layout.addRow("F3 截图" if self._ui_lang != "en" else "F3 Screenshot", self._hk_f3)
-        hotkey_layout.addRow("F4 对话" if self._ui_lang != "en" else "F4 Chat", self._hk_f4)
-        hotkey_layout.addRow("F5 仪表盘" if self._ui_lang != "en" else "F5 Dashboard", self._hk_f5)
+        ph = "点击后按组合键" if self._ui_lang != "en" else "Click and press keys"
+        self._hk_f1 = _HotkeyEdit(hotkey_box, placeholder=ph)
+        self._hk_f2 = _HotkeyEdit(hotkey_box, placeholder=ph)
+        self._hk_f3 = _HotkeyEdit(hotkey_box, placeholder=ph)
+        self._hk_f4 = _HotkeyEdit(hotkey_box, placeholder=ph)
+        self._hk_f5 = _HotkeyEdit(hotkey_box, placeholder=ph)
+
+        self._hk_labels = _HK_LABELS_EN if self._ui_lang == "en" else _HK_LABELS_ZH
+        self._hk_edits = {
+            "f1": self._hk_f1,
+            "f2": self._hk_f2,
+            "f3": self._hk_f3,
+            "f4": self._hk_f4,
+            "f5": self._hk_f5,
+        }
+        for name, edit in self._hk_edits.items():
+            hotkey_layout.addRow(self._hk_labels[name], edit)
 
         hk_btn_row = QWidget(hotkey_box)
         hk_btn_layout = QHBoxLayout(hk_btn_row)
@@ -647,13 +709,13 @@ class _SettingsDialog(QDialog):
         api_layout = QFormLayout(api_box)
         api_layout.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
 
+        self._profile_names = self._store.list_profiles()
+        self._profiles: dict[str, ApiProfile] = {}
         self._profile_combo = QComboBox(api_box)
-        for n in self._store.list_profiles():
-            self._profile_combo.addItem(n, n)
-        self._set_combo_by_data(self._profile_combo, self._store.get_selected_profile())
+        self._fill_profile_combo(self._store.get_selected_profile())
         api_layout.addRow("配置名称" if self._ui_lang != "en" else "Profile", self._profile_combo)
 
-        p = self._store.get_profile(str(self._profile_combo.currentData() or "default"))
+        p = self._profile(str(self._profile_combo.currentData() or "default"))
         self._base_url = QLineEdit(api_box)
         self._base_url.setText(p.base_url)
         self._base_url.setPlaceholderText("https://api.example.com/v1")
@@ -676,9 +738,7 @@ class _SettingsDialog(QDialog):
 
         self._show_key = QCheckBox("显示" if self._ui_lang != "en" else "Show", key_row)
         self._show_key.setChecked(False)
-        self._show_key.toggled.connect(
-            lambda on: self._api_key.setEchoMode(QLineEdit.Normal if on else QLineEdit.Password)
-        )
+        self._show_key.toggled.connect(self._on_show_key_toggled)
         key_row_layout.addWidget(self._api_key, 1)
         key_row_layout.addWidget(self._show_key)
         api_layout.addRow("API Key", key_row)
@@ -702,101 +762,124 @@ class _SettingsDialog(QDialog):
         self._btn_save.clicked.connect(self._save)
         self._btn_delete.clicked.connect(self._delete)
         self._btn_hotkeys_reset.clicked.connect(self._reset_hotkeys)
-        self._btn_hotkeys_save.clicked.connect(lambda: self._save_hotkeys(show_success=True))
+        self._btn_hotkeys_save.clicked.connect(self._on_save_hotkeys_clicked)
         self._btn_ok.clicked.connect(self._ok)
 
+    @property
+    def ui_lang(self) -> str:
+        return self._ui_lang
+
+    def refresh(self) -> None:
+        self._set_combo_by_data(self._lang_combo, self._store.get_ui_language())
+        self._llm_enable.setChecked(self._store.get_llm_enabled())
+        self._profile_names = self._store.list_profiles()
+        self._profiles.clear()
+        self._fill_profile_combo(self._store.get_selected_profile())
+        p = self._profile(str(self._profile_combo.currentData() or "default"))
+        self._base_url.setText(p.base_url)
+        self._model.setText(p.model)
+        self._api_key.setText(p.api_key)
+        self._show_key.setChecked(False)
+        self._load_hotkeys()
+
     def _set_combo_by_data(self, combo: QComboBox, value: str) -> None:
-        value = str(value or "")
-        for i in range(combo.count()):
-            if str(combo.itemData(i)) == value:
-                combo.setCurrentIndex(i)
-                return
-        combo.setCurrentIndex(0)
+        index = getattr(combo, "_data_index", None) or {}
+        combo.setCurrentIndex(index.get(str(value or ""), 0))
+
+    def _on_show_key_toggled(self, on: bool) -> None:
+        self._api_key.setEchoMode(QLineEdit.Normal if on else QLineEdit.Password)
+
+    def _on_save_hotkeys_clicked(self) -> None:
+        self._save_hotkeys(show_success=True)
+
+    def _fill_profile_combo(self, selected: str) -> None:
+        combo = self._profile_combo
+        combo.blockSignals(True)
+        _clear_combo(combo)
+        for n in self._profile_names:
+            _add_combo_item(combo, n, n)
+        self._set_combo_by_data(combo, selected)
+        combo.blockSignals(False)
+
+    def _profile(self, name: str) -> ApiProfile:
+        p = self._profiles.get(name)
+        if p is None:
+            p = self._profiles[name] = self._store.get_profile(name)
+        return p
+
+    @staticmethod
+    def _s(v, d: str = "") -> str:
+        return str(v or d).strip()
 
     def _load_profile(self) -> None:
         name = str(self._profile_combo.currentData() or "default")
-        p = self._store.get_profile(name)
+        p = self._profile(name)
         self._base_url.setText(p.base_url)
         self._model.setText(p.model)
         self._api_key.setText(p.api_key)
         self._store.set_selected_profile(name)
 
     def _save(self) -> None:
-        name = str(self._profile_combo.currentData() or "default").strip() or "default"
+        s = self._s
+        name = s(self._profile_combo.currentData(), "default") or "default"
         p = ApiProfile(
             name=name,
-            base_url=str(self._base_url.text() or "").strip(),
-            api_key=str(self._api_key.text() or "").strip(),
-            model=str(self._model.text() or "").strip(),
+            base_url=s(self._base_url.text()),
+            api_key=s(self._api_key.text()),
+            model=s(self._model.text()),
         )
         self._store.upsert_profile(p)
+        self._profiles[name] = p
         self._store.set_selected_profile(name)
         QMessageBox.information(
             self, "提示" if self._ui_lang != "en" else "Info", "已保存" if self._ui_lang != "en" else "Saved"
         )
 
     def _delete(self) -> None:
-        name = str(self._profile_combo.currentData() or "default").strip()
+        name = self._s(self._profile_combo.currentData(), "default")
         if not name or name == "default":
             return
         self._store.delete_profile(name)
-        self._profile_combo.clear()
-        for n in self._store.list_profiles():
-            self._profile_combo.addItem(n, n)
-        self._set_combo_by_data(self._profile_combo, self._store.get_selected_profile())
+        self._profiles.pop(name, None)
+        self._profile_names = [n for n in self._profile_names if n != name]
+        self._fill_profile_combo(self._store.get_selected_profile())
         self._load_profile()
 
     def _ok(self) -> None:
         self._store.set_ui_language(str(self._lang_combo.currentData() or "zh-CN"))
         self._store.set_llm_enabled(bool(self._llm_enable.isChecked()))
-        self._store.set_selected_profile(str(self._profile_combo.currentData() or "default"))
+        self._store.set_selected_profile(self._s(self._profile_combo.currentData(), "default"))
         if not self._save_hotkeys(show_success=False):
             return
         self.accept()
 
     def _load_hotkeys(self) -> None:
         hk = self._store.get_hotkeys()
-        self._hk_f1.set_hotkey(int(hk.get("f1", {}).get("mods", 0)), int(hk.get("f1", {}).get("vk", 0x70)))
-        self._hk_f2.set_hotkey(int(hk.get("f2", {}).get("mods", 0)), int(hk.get("f2", {}).get("vk", 0x71)))
-        self._hk_f3.set_hotkey(int(hk.get("f3", {}).get("mods", 0)), int(hk.get("f3", {}).get("vk", 0x72)))
-        self._hk_f4.set_hotkey(int(hk.get("f4", {}).get("mods", 0)), int(hk.get("f4", {}).get("vk", 0x73)))
-        self._hk_f5.set_hotkey(int(hk.get("f5", {}).get("mods", 0)), int(hk.get("f5", {}).get("vk", 0x74)))
+        for name, dmods, dvk in _DEFAULT_HK:
+            entry = hk.get(name) or {}
+            self._hk_edits[name].set_hotkey(entry.get("mods", dmods), entry.get("vk", dvk))
 
     def _reset_hotkeys(self) -> None:
-        self._hk_f1.set_hotkey(0, 0x70)
-        self._hk_f2.set_hotkey(0, 0x71)
-        self._hk_f3.set_hotkey(0, 0x72)
-        self._hk_f4.set_hotkey(0, 0x73)
-        self._hk_f5.set_hotkey(0, 0x74)
+        for name, dmods, dvk in _DEFAULT_HK:
+            self._hk_edits[name].set_hotkey(dmods, dvk)
 
     def _collect_hotkeys(self) -> dict[str, dict[str, int]]:
-        return {
-            "f1": self._hk_f1.hotkey(),
-            "f2": self._hk_f2.hotkey(),
-            "f3": self._hk_f3.hotkey(),
-            "f4": self._hk_f4.hotkey(),
-            "f5": self._hk_f5.hotkey(),
-        }
+        return {name: edit.hotkey() for name, edit in self._hk_edits.items()}
 
     def _save_hotkeys(self, show_success: bool) -> bool:
         hk = self._collect_hotkeys()
-        labels = {
-            "f1": "F1 划词" if self._ui_lang != "en" else "F1 Hover",
-            "f2": "F2 打字" if self._ui_lang != "en" else "F2 Type",
-            "f3": "F3 截图" if self._ui_lang != "en" else "F3 Screenshot",
-            "f4": "F4 对话" if self._ui_lang != "en" else "F4 Chat",
-            "f5": "F5 仪表盘" if self._ui_lang != "en" else "F5 Dashboard",
-        }
+        labels = self._hk_labels
         seen: dict[tuple[int, int], str] = {}
-        conflicts: list[tuple[str, str, str]] = []
+        conflicts: list[tuple[str, str, tuple[int, int]]] = []
         for k, v in hk.items():
-            key = (int(v.get("mods", 0)), int(v.get("vk", 0)))
-            if key in seen:
-                conflicts.append((labels.get(seen[key], seen[key]), labels.get(k, k), _format_hotkey(*key)))
-            else:
-                seen[key] = k
+            key = (v["mods"], v["vk"])
+            first = seen.setdefault(key, k)
+            if first != k:
+                conflicts.append((first, k, key))
         if conflicts:
-            msg = "\n".join([f"{a} / {b}: {combo}" for a, b, combo in conflicts[:3]])
+            msg = "\n".join(
+                [f"{labels.get(a, a)} / {labels.get(b, b)}: {_format_hotkey(*key)}" for a, b, key in conflicts[:3]]
+            )
             QMessageBox.warning(
                 self,
                 "冲突" if self._ui_lang != "en" else "Conflict",
@@ -5,23 +5,81 @@ import os
 import shutil
 import tempfile
 from pathlib import Path
-from urllib.request import urlretrieve
+from concurrent.futures import ThreadPoolExecutor
+from urllib.request import Request, urlopen, urlretrieve
+
+_RANGE_PARTS = 8
+_RANGE_MIN_SIZE = 1 << 20
+_CHUNK = 1 << 16
 
 
 def _require_hf() -> tuple[object, object]:
-    try:
-        from huggingface_hub import snapshot_download  # type: ignore
-    except Exception as e:
-        raise SystemExit(f"Missing dependency huggingface_hub: {e}")
+    # huggingface_hub reads HF_HUB_ENABLE_HF_TRANSFER at import time, so set it first.
     try:
         import hf_transfer  # noqa: F401
 
         os.environ["HF_HUB_ENABLE_HF_TRANSFER"] = "1"
     except Exception:
         pass
+    try:
+        from huggingface_hub import snapshot_download  # type: ignore
+    except Exception as e:
+        raise SystemExit(f"Missing dependency huggingface_hub: {e}")
     return snapshot_download, None
 
 
+def _fetch_range(url: str, path: Path, start: int, end: int) -> None:
+    req = Request(url, headers={"Range": f"bytes={start}-{end}"})
+    written = 0
+    with urlopen(req) as resp, open(path, "r+b") as f:
+        if resp.status != 206:
+            raise OSError(f"Range request not honoured (HTTP {resp.status})")
+        f.seek(start)
+        while True:
+            buf = resp.read(_CHUNK)
+            if not buf:
+                break
+            f.write(buf)
+            written += len(buf)
+    # The file is preallocated, so a short stream would not show up in its size.
+    if written != end - start + 1:
+        raise OSError(f"Range {start}-{end} ended after {written} bytes")
+
+
+def _probe(url: str) -> tuple[str, int]:
+    # A one-byte ranged GET, since urllib turns HEAD into GET when following a redirect.
+    with urlopen(Request(url, headers={"Range": "bytes=0-0"})) as resp:
+        final_url = resp.geturl()
+        if resp.status != 206:
+            return final_url, 0
+        total = (resp.headers.get("Content-Range") or "").rpartition("/")[2]
+    return final_url, int(total) if total.isdigit() else 0
+
+
+def _download_file(url: str, dest: Path) -> None:
+    """Download url to dest using parallel byte ranges when the server allows it."""
+    try:
+        final_url, size = _probe(url)
+    except OSError:
+        urlretrieve(url, dest)
+        return
+
+    if size < _RANGE_MIN_SIZE:
+        urlretrieve(final_url, dest)
+        return
+
+    with open(dest, "wb") as f:
+        f.truncate(size)
+    step = -(-size // _RANGE_PARTS)
+    ranges = [(a, min(a + step, size) - 1) for a in range(0, size, step)]
+    try:
+        with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+            for fut in [pool.submit(_fetch_range, final_url, dest, a, b) for a, b in ranges]:
+                fut.result()
+    except OSError:
+        urlretrieve(final_url, dest)
+
+
 def _download_nllb(models_dir: Path) -> None:
     snapshot_download, _ = _require_hf()
     out_dir = (models_dir / "nllb-200-1.3b-int8").resolve()
@@ -40,7 +98,7 @@ def _download_nllb(models_dir: Path) -> None:
             "/resolve/main/flores200_sacrebleu_tokenizer_spm.model"
         )
         try:
-            urlretrieve(url, tmp)
+            _download_file(url, tmp)
             tmp.replace(src)
         finally:
             if tmp.exists():
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -34,18 +35,35 @@ def _draw_icon(size: int) -> "Image.Image":
     return img
 
 
+def _draw_icons(sizes: list[int]) -> list["Image.Image"]:
+    from PIL import Image
+
+    top = max(sizes)
+    master = _draw_icon(top)
+    return [master if s == top else master.resize((s, s), Image.LANCZOS) for s in sizes]
+
 
+def _load_logo(path: Path, remove_light_bg: bool) -> "Image.Image":
+    return _load_logo_cached(str(path), path.stat().st_mtime_ns, remove_light_bg)
 
-def _from_logo(path: Path, size: int, remove_light_bg: bool) -> "Image.Image":
+
+@lru_cache(maxsize=32)
+def _load_logo_cached(path: str, mtime_ns: int, remove_light_bg: bool) -> "Image.Image":
     from PIL import Image
 
     img = Image.open(path).convert("RGBA")
     if remove_light_bg:
         img = _remove_light_background(img)
-    
     w, h = img.size
     if w <= 0 or h <= 0:
         raise ValueError("Invalid logo image")
+    return img
+
+
+def _from_logo(img: "Image.Image", size: int) -> "Image.Image":
+    from PIL import Image
+
+    w, h = img.size
     
     # Scale to fit within the icon size while maintaining aspect ratio
     scale = min(size / w, size / h)
@@ -53,7 +71,8 @@ def _from_logo(path: Path, size: int, remove_light_bg: bool) -> "Image.Image":
     nh = max(1, int(round(h * scale)))
     
     # High-quality resize
-    img = img.resize((nw, nh), Image.LANCZOS)
+    if (nw, nh) != (w, h):
+        img = img.resize((nw, nh), Image.LANCZOS, reducing_gap=3.0)
     
     canvas = Image.new("RGBA", (size, size), (0, 0, 0, 0))
     x = (size - nw) // 2
@@ -63,61 +82,32 @@ def _from_logo(path: Path, size: int, remove_light_bg: bool) -> "Image.Image":
 
 
 def _remove_light_background(img: "Image.Image") -> "Image.Image":
+    import numpy as np
     from PIL import Image
 
     rgba = img.convert("RGBA")
-    px = rgba.load()
     w, h = rgba.size
     if w <= 2 or h <= 2:
         return rgba
 
-    def sample(x: int, y: int) -> tuple[int, int, int]:
-        r, g, b, _a = px[x, y]
-        return int(r), int(g), int(b)
-
-    samples = [
-        sample(0, 0),
-        sample(w - 1, 0),
-        sample(0, h - 1),
-        sample(w - 1, h - 1),
-        sample(w // 2, 0),
-        sample(w // 2, h - 1),
-        sample(0, h // 2),
-        sample(w - 1, h // 2),
-    ]
-    bg_r = sum(s[0] for s in samples) / len(samples)
-    bg_g = sum(s[1] for s in samples) / len(samples)
-    bg_b = sum(s[2] for s in samples) / len(samples)
-
-    def dist2(r: int, g: int, b: int) -> float:
-        dr = r - bg_r
-        dg = g - bg_g
-        db = b - bg_b
-        return dr * dr + dg * dg + db * db
+    arr = np.asarray(rgba, dtype=np.uint8)
+    border = np.concatenate([arr[0], arr[-1], arr[:, 0], arr[:, -1]], axis=0)
+    bg_rgb = border[:, :3].astype(np.float32).mean(axis=0)
 
     max_bg_dist2 = 55.0 * 55.0
     soften_dist2 = 95.0 * 95.0
 
-    out = Image.new("RGBA", (w, h), (0, 0, 0, 0))
-    out_px = out.load()
-    for y in range(h):
-        for x in range(w):
-            r, g, b, a = px[x, y]
-            if a == 0:
-                continue
-            lum = 0.2126 * r + 0.7152 * g + 0.0722 * b
-            d2 = dist2(r, g, b)
-            if lum >= 235 and d2 <= soften_dist2:
-                if d2 <= max_bg_dist2:
-                    continue
-                t = (d2 - max_bg_dist2) / (soften_dist2 - max_bg_dist2)
-                na = int(round(a * max(0.0, min(1.0, t))))
-                if na <= 0:
-                    continue
-                out_px[x, y] = (r, g, b, na)
-            else:
-                out_px[x, y] = (r, g, b, a)
-    return out
+    rgb = arr[..., :3].astype(np.float32)
+    alpha = arr[..., 3]
+    lum = rgb @ np.array([0.2126, 0.7152, 0.0722], dtype=np.float32)
+    d2 = ((rgb - bg_rgb) ** 2).sum(axis=-1)
+    t = np.clip((d2 - max_bg_dist2) / (soften_dist2 - max_bg_dist2), 0.0, 1.0)
+    light = (lum >= 235) & (d2 <= soften_dist2)
+    new_a = np.where(light, np.round(alpha * t), alpha).astype(np.uint8)
+
+    out = np.dstack([arr[..., :3], new_a])
+    out[new_a == 0] = 0
+    return Image.fromarray(out, "RGBA")
 
 
 def main() -> int:
@@ -135,7 +125,8 @@ def main() -> int:
     remove_light_bg = False
 
     sizes = [16, 20, 24, 32, 48, 64, 128, 256]
-    images = [(_from_logo(logo_path, s, remove_light_bg) if use_logo else _draw_icon(s)) for s in sizes]
+    logo = _load_logo(logo_path, remove_light_bg) if use_logo else None
+    images = [_from_logo(logo, s) for s in sizes] if logo is not None else _draw_icons(sizes)
     images[0].save(out_path, format="ICO", sizes=[(s, s) for s in sizes])
     return 0
 
@@ -3,7 +3,9 @@ from __future__ import annotations
 import base64
 import ctypes
 import json
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from PySide6.QtCore import QSettings
@@ -20,6 +22,26 @@ class ApiProfile:
 class SettingsStore:
     def __init__(self) -> None:
         self._qs = QSettings("chai1220", "FlashTrans")
+        self._json_cache: dict[str, tuple[str, dict[str, Any] | None]] = {}
+        self._plain_cache: dict[str, str] = {}
+
+    def _json_dict(self, key: str) -> dict[str, Any] | None:
+        # Parsed values are keyed on the raw string, so writes made through another
+        # SettingsStore instance are still picked up.
+        raw = str(self._qs.value(key, "") or "")
+        if not raw:
+            return None
+        hit = self._json_cache.get(key)
+        if hit is not None and hit[0] == raw:
+            return hit[1]
+        try:
+            obj = json.loads(raw)
+        except Exception:
+            obj = None
+        if not isinstance(obj, dict):
+            obj = None
+        self._json_cache[key] = (raw, obj)
+        return obj
 
     def get_ui_language(self) -> str:
         v = str(self._qs.value("ui_language", "zh-CN"))
@@ -51,14 +73,8 @@ class SettingsStore:
         self._qs.setValue("api_selected_profile", str(name or "default").strip() or "default")
 
     def list_profiles(self) -> list[str]:
-        raw = str(self._qs.value("api_profiles", "") or "")
-        if not raw:
-            return ["default"]
-        try:
-            obj = json.loads(raw)
-        except Exception:
-            return ["default"]
-        if not isinstance(obj, dict):
+        obj = self._json_dict("api_profiles")
+        if obj is None:
             return ["default"]
         names = [str(k) for k in obj.keys() if str(k).strip()]
         if "default" not in names:
@@ -67,11 +83,10 @@ class SettingsStore:
 
     def get_profile(self, name: str | None = None) -> ApiProfile:
         name = str(name or self.get_selected_profile() or "default").strip() or "default"
-        raw = str(self._qs.value("api_profiles", "") or "")
-        if raw:
+        obj = self._json_dict("api_profiles")
+        if obj is not None:
             try:
-                obj = json.loads(raw)
-                if isinstance(obj, dict) and isinstance(obj.get(name), dict):
+                if isinstance(obj.get(name), dict):
                     it = obj[name]
                     return ApiProfile(
                         name=name,
@@ -84,15 +99,7 @@ class SettingsStore:
         return ApiProfile(name=name, base_url="", api_key="", model="")
 
     def upsert_profile(self, profile: ApiProfile) -> None:
-        raw = str(self._qs.value("api_profiles", "") or "")
-        obj: dict[str, Any] = {}
-        if raw:
-            try:
-                loaded = json.loads(raw)
-                if isinstance(loaded, dict):
-                    obj = loaded
-            except Exception:
-                obj = {}
+        obj: dict[str, Any] = dict(self._json_dict("api_profiles") or {})
 
         name = str(profile.name or "default").strip() or "default"
         obj[name] = {
@@ -106,17 +113,11 @@ class SettingsStore:
         name = str(name or "").strip()
         if not name or name == "default":
             return
-        raw = str(self._qs.value("api_profiles", "") or "")
-        if not raw:
-            return
-        try:
-            obj = json.loads(raw)
-        except Exception:
-            return
-        if not isinstance(obj, dict):
+        obj = self._json_dict("api_profiles")
+        if obj is None:
             return
         if name in obj:
-            obj.pop(name, None)
+            obj = {k: v for k, v in obj.items() if k != name}
             self._qs.setValue("api_profiles", json.dumps(obj, ensure_ascii=False))
         if self.get_selected_profile() == name:
             self.set_selected_profile("default")
@@ -145,14 +146,8 @@ class SettingsStore:
             "f4": {"vk": 0x73, "mods": 0},
             "f5": {"vk": 0x74, "mods": 0},
         }
-        raw = str(self._qs.value("hotkeys", "") or "")
-        if not raw:
-            return defaults
-        try:
-            obj = json.loads(raw)
-        except Exception:
-            return defaults
-        if not isinstance(obj, dict):
+        obj = self._json_dict("hotkeys")
+        if obj is None:
             return defaults
 
         out: dict[str, dict[str, int]] = {}
@@ -196,71 +191,82 @@ class SettingsStore:
         cipher_b64 = str(cipher_b64 or "")
         if not cipher_b64:
             return ""
+        hit = self._plain_cache.get(cipher_b64)
+        if hit is not None:
+            return hit
         try:
             blob = base64.b64decode(cipher_b64.encode("ascii"), validate=False)
-            plain = _dpapi_decrypt(blob)
-            return plain.decode("utf-8", errors="ignore")
+            plain = _dpapi_decrypt(blob).decode("utf-8", errors="ignore")
         except Exception:
             return ""
+        self._plain_cache[cipher_b64] = plain
+        return plain
 
 
 class _DATA_BLOB(ctypes.Structure):
     _fields_ = [("cbData", ctypes.c_uint32), ("pbData", ctypes.POINTER(ctypes.c_ubyte))]
 
 
-_crypt32 = ctypes.WinDLL("crypt32", use_last_error=True)
-_kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
-
-_CryptProtectData = _crypt32.CryptProtectData
-_CryptProtectData.argtypes = [
-    ctypes.POINTER(_DATA_BLOB),
-    ctypes.c_wchar_p,
-    ctypes.POINTER(_DATA_BLOB),
-    ctypes.c_void_p,
-    ctypes.c_void_p,
-    ctypes.c_uint32,
-    ctypes.POINTER(_DATA_BLOB),
-]
-_CryptProtectData.restype = ctypes.c_int
-
-_CryptUnprotectData = _crypt32.CryptUnprotectData
-_CryptUnprotectData.argtypes = [
-    ctypes.POINTER(_DATA_BLOB),
-    ctypes.POINTER(ctypes.c_wchar_p),
-    ctypes.POINTER(_DATA_BLOB),
-    ctypes.c_void_p,
-    ctypes.c_void_p,
-    ctypes.c_uint32,
-    ctypes.POINTER(_DATA_BLOB),
-]
-_CryptUnprotectData.restype = ctypes.c_int
-
-_LocalFree = _kernel32.LocalFree
-_LocalFree.argtypes = [ctypes.c_void_p]
-_LocalFree.restype = ctypes.c_void_p
+@lru_cache(maxsize=None)
+def _dpapi() -> tuple[Any, Any, Any]:
+    if sys.platform != "win32":
+        raise OSError("DPAPI is only available on Windows")
+    crypt32 = ctypes.WinDLL("crypt32", use_last_error=True)
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+    protect = crypt32.CryptProtectData
+    protect.argtypes = [
+        ctypes.POINTER(_DATA_BLOB),
+        ctypes.c_wchar_p,
+        ctypes.POINTER(_DATA_BLOB),
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        ctypes.c_uint32,
+        ctypes.POINTER(_DATA_BLOB),
+    ]
+    protect.restype = ctypes.c_int
+
+    unprotect = crypt32.CryptUnprotectData
+    unprotect.argtypes = [
+        ctypes.POINTER(_DATA_BLOB),
+        ctypes.POINTER(ctypes.c_wchar_p),
+        ctypes.POINTER(_DATA_BLOB),
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        ctypes.c_uint32,
+        ctypes.POINTER(_DATA_BLOB),
+    ]
+    unprotect.restype = ctypes.c_int
+
+    local_free = kernel32.LocalFree
+    local_free.argtypes = [ctypes.c_void_p]
+    local_free.restype = ctypes.c_void_p
+    return protect, unprotect, local_free
 
 
 def _dpapi_encrypt(data: bytes) -> bytes:
-    in_buf = (ctypes.c_ubyte * len(data)).from_buffer_copy(data)
+    protect, _unprotect, local_free = _dpapi()
+    in_buf = ctypes.create_string_buffer(data, len(data))
     in_blob = _DATA_BLOB(cbData=len(data), pbData=ctypes.cast(in_buf, ctypes.POINTER(ctypes.c_ubyte)))
     out_blob = _DATA_BLOB()
-    ok = _CryptProtectData(ctypes.byref(in_blob), None, None, None, None, 0, ctypes.byref(out_blob))
+    ok = protect(ctypes.byref(in_blob), None, None, None, None, 0, ctypes.byref(out_blob))
     if not ok:
         raise OSError(ctypes.get_last_error())
     try:
         return ctypes.string_at(out_blob.pbData, out_blob.cbData)
     finally:
-        _LocalFree(out_blob.pbData)
+        local_free(out_blob.pbData)
 
 
 def _dpapi_decrypt(data: bytes) -> bytes:
-    in_buf = (ctypes.c_ubyte * len(data)).from_buffer_copy(data)
+    _protect, unprotect, local_free = _dpapi()
+    in_buf = ctypes.create_string_buffer(data, len(data))
     in_blob = _DATA_BLOB(cbData=len(data), pbData=ctypes.cast(in_buf, ctypes.POINTER(ctypes.c_ubyte)))
     out_blob = _DATA_BLOB()
-    ok = _CryptUnprotectData(ctypes.byref(in_blob), None, None, None, None, 0, ctypes.byref(out_blob))
+    ok = unprotect(ctypes.byref(in_blob), None, None, None, None, 0, ctypes.byref(out_blob))
     if not ok:
         raise OSError(ctypes.get_last_error())
     try:
         return ctypes.string_at(out_blob.pbData, out_blob.cbData)
     finally:
-        _LocalFree(out_blob.pbData)
+        local_free(out_blob.pbData)
@@ -1,10 +1,8 @@
 from __future__ import annotations
 
-import time
-
-from PySide6.QtCore import QRect, QPoint, Qt, Signal
-from PySide6.QtGui import QColor, QGuiApplication, QImage, QPainter, QPen, QPixmap
-from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtCore import QRect, QPoint, Qt, QTimer, Signal
+from PySide6.QtGui import QColor, QGuiApplication, QPainter, QPen, QPixmap, QRegion
+from PySide6.QtWidgets import QWidget
 
 
 class SnippingOverlay(QWidget):
@@ -25,6 +23,8 @@ class SnippingOverlay(QWidget):
         self._start: QPoint | None = None
         self._end: QPoint | None = None
         self._dragging = False
+        self._pending_update = False
+        self._painted_rect = QRect()
 
     def begin(self) -> None:
         screens = QGuiApplication.screens()
@@ -49,18 +49,20 @@ class SnippingOverlay(QWidget):
 
     def paintEvent(self, event) -> None:
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing, True)
-
-        painter.fillRect(self.rect(), QColor(0, 0, 0, 120))
+        dim = QColor(0, 0, 0, 120)
 
         rect = self._selection_rect()
         if rect is None:
+            painter.fillRect(self.rect(), dim)
             return
 
-        painter.setCompositionMode(QPainter.CompositionMode_Clear)
-        painter.fillRect(rect, QColor(0, 0, 0, 0))
-        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+        # The translucent backing store starts cleared, so leaving the selection
+        # out of the clip is enough to keep it see-through.
+        painter.setClipRegion(QRegion(self.rect()).subtracted(QRegion(rect)))
+        painter.fillRect(self.rect(), dim)
+        painter.setClipping(False)
 
+        painter.setRenderHint(QPainter.Antialiasing, True)
         pen = QPen(QColor(0, 180, 255, 220), 2)
         painter.setPen(pen)
         painter.drawRect(rect)
@@ -74,6 +76,7 @@ class SnippingOverlay(QWidget):
             self._start = event.globalPos()
         self._end = self._start
         self._dragging = True
+        self._painted_rect = self._selection_rect() or QRect()
         self.update()
 
     def mouseMoveEvent(self, event) -> None:
@@ -83,7 +86,16 @@ class SnippingOverlay(QWidget):
             self._end = event.globalPosition().toPoint()
         else:
             self._end = event.globalPos()
-        self.update()
+        if not self._pending_update:
+            self._pending_update = True
+            QTimer.singleShot(0, self._flush_update)
+
+    def _flush_update(self) -> None:
+        self._pending_update = False
+        rect = self._selection_rect() or QRect()
+        dirty = self._painted_rect.united(rect).adjusted(-2, -2, 2, 2)
+        self._painted_rect = rect
+        self.update(dirty)
 
     def mouseReleaseEvent(self, event) -> None:
         if event.button() != Qt.LeftButton:
@@ -97,9 +109,10 @@ class SnippingOverlay(QWidget):
             return
 
         self.hide()
-        QApplication.processEvents()
-        time.sleep(0.06)
+        # Give the compositor one frame to drop the overlay before grabbing.
+        QTimer.singleShot(16, lambda: self._do_capture(global_rect))
 
+    def _do_capture(self, global_rect: QRect) -> None:
         pixmap = self._grab_virtual_rect(global_rect)
 
         self._reset_and_hide()
@@ -138,7 +151,7 @@ class SnippingOverlay(QWidget):
         if not screens:
             return QPixmap()
 
-        parts: list[tuple[QImage, int, int]] = []
+        parts: list[tuple[QPixmap, int, int]] = []
         max_w = 0
         max_h = 0
 
@@ -147,40 +160,31 @@ class SnippingOverlay(QWidget):
             inter = global_rect.intersected(sg)
             if inter.isEmpty():
                 continue
-            full = screen.grabWindow(0)
-            if full.isNull():
-                continue
-            img = full.toImage()
-            if img.isNull() or sg.width() <= 0 or sg.height() <= 0:
-                continue
-            sx = img.width() / float(sg.width())
-            sy = img.height() / float(sg.height())
-
-            px_x = int(round((inter.x() - sg.x()) * sx))
-            px_y = int(round((inter.y() - sg.y()) * sy))
-            px_w = int(round(inter.width() * sx))
-            px_h = int(round(inter.height() * sy))
-            if px_w <= 0 or px_h <= 0:
-                continue
-            crop = img.copy(px_x, px_y, px_w, px_h)
-            if crop.isNull():
+            part = screen.grabWindow(0, inter.x() - sg.x(), inter.y() - sg.y(), inter.width(), inter.height())
+            if part.isNull():
                 continue
+            # Stitch in device pixels regardless of each screen's scale factor.
+            part.setDevicePixelRatio(1.0)
+            sx = part.width() / float(inter.width())
+            sy = part.height() / float(inter.height())
 
             off_x = int(round((inter.x() - global_rect.x()) * sx))
             off_y = int(round((inter.y() - global_rect.y()) * sy))
-            parts.append((crop, off_x, off_y))
-            max_w = max(max_w, off_x + crop.width())
-            max_h = max(max_h, off_y + crop.height())
+            parts.append((part, off_x, off_y))
+            max_w = max(max_w, off_x + part.width())
+            max_h = max(max_h, off_y + part.height())
 
         if not parts or max_w <= 0 or max_h <= 0:
             return QPixmap()
+        if len(parts) == 1:
+            return parts[0][0]
 
-        canvas = QImage(max_w, max_h, QImage.Format_RGBA8888)
-        canvas.fill(QColor(0, 0, 0, 0))
+        canvas = QPixmap(max_w, max_h)
+        canvas.fill(Qt.transparent)
         painter = QPainter(canvas)
         try:
-            for img, x, y in parts:
-                painter.drawImage(x, y, img)
+            for pm, x, y in parts:
+                painter.drawPixmap(x, y, pm)
         finally:
             painter.end()
-        return QPixmap.fromImage(canvas)
+        return canvas
@@ -1,20 +1,21 @@
 from __future__ import annotations
 
+import time
+import weakref
+
 from PySide6.QtCore import QObject, QPoint, QRect, Qt, Signal, QEvent, QTimer
-from PySide6.QtGui import QCursor, QGuiApplication
+from PySide6.QtGui import QColor, QCursor, QGuiApplication, QPainter, QPen
 from PySide6.QtWidgets import QLabel, QLineEdit, QPlainTextEdit, QPushButton, QVBoxLayout, QWidget
 
 
+# Every rule is scoped under #PopupCard so the sheet can live on the application
+# without restyling the dashboard or dialogs. The card itself is painted by _Card.
 _QSS_POPUP = """
-QWidget#PopupCard {
-    background: rgba(18, 20, 24, 245);
-    border: 2px solid rgba(88, 135, 255, 220);
-    border-radius: 12px;
-    color: #ffffff;
+#PopupCard QLineEdit, #PopupCard QLabel, #PopupCard QPlainTextEdit, #PopupCard QPushButton {
     font-family: "Microsoft YaHei UI";
     font-size: 12px;
 }
-QLineEdit {
+#PopupCard QLineEdit {
     background: rgba(10, 12, 16, 255);
     border: 1px solid rgba(255, 255, 255, 60);
     border-radius: 10px;
@@ -22,16 +23,16 @@ QLineEdit {
     color: #ffffff;
     selection-background-color: rgba(88, 135, 255, 160);
 }
-QLabel {
+#PopupCard QLabel {
     padding: 6px 10px;
     color: #ffffff;
 }
-QLabel#PopupTitle {
+#PopupCard QLabel#PopupTitle {
     font-size: 14px;
     font-weight: 600;
     padding: 6px 10px;
 }
-QPlainTextEdit {
+#PopupCard QPlainTextEdit {
     background: rgba(10, 12, 16, 255);
     border: 1px solid rgba(255, 255, 255, 60);
     border-radius: 10px;
@@ -39,46 +40,159 @@ QPlainTextEdit {
     color: #ffffff;
     selection-background-color: rgba(88, 135, 255, 160);
 }
-QPushButton {
+#PopupCard QPushButton {
     background: rgba(25, 28, 36, 255);
     border: 1px solid rgba(255, 255, 255, 60);
     border-radius: 8px;
     padding: 6px 10px;
     color: #ffffff;
 }
-QPushButton:hover {
+#PopupCard QPushButton:hover {
     background: rgba(35, 40, 52, 255);
 }
 """
 
 
+def install_popup_styles(app) -> None:
+    if app is None or app.property("_popup_styles"):
+        return
+    app.setProperty("_popup_styles", True)
+    app.setStyleSheet((app.styleSheet() or "") + _QSS_POPUP)
+
+
+_CARD_BRUSH = QColor(18, 20, 24, 245)
+_CARD_PEN = QPen(QColor(88, 135, 255, 220), 2)
+
+
+class _Card(QWidget):
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.setObjectName("PopupCard")
+
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setPen(_CARD_PEN)
+        painter.setBrush(_CARD_BRUSH)
+        painter.drawRoundedRect(self.rect().adjusted(1, 1, -1, -1), 12, 12)
+
+
+_MBP_INT = int(QEvent.MouseButtonPress)
+_K_RET = int(Qt.Key_Return)
+_K_ENT = int(Qt.Key_Enter)
+_K_ESC = int(Qt.Key_Escape)
+_TYPING_DEBOUNCE_S = 0.26
+_TYPING_TICK_MS = 80
+
+
+_FALLBACK_BOUNDS = (0, 0, 1919, 1079)
+_screen_cache: list[tuple[tuple[int, int, int, int], tuple[int, int, int, int]]] | None = None
+_primary_bounds: tuple[int, int, int, int] = _FALLBACK_BOUNDS
+
+
+def _rect_bounds(r: QRect) -> tuple[int, int, int, int]:
+    return r.left(), r.top(), r.right(), r.bottom()
+
+
+def _invalidate_screens(*_args) -> None:
+    global _screen_cache
+    _screen_cache = None
+
+
+def _load_screens() -> list[tuple[tuple[int, int, int, int], tuple[int, int, int, int]]]:
+    global _screen_cache, _primary_bounds
+    app = QGuiApplication.instance()
+    if app is not None and not app.property("_popup_screen_hooks"):
+        app.setProperty("_popup_screen_hooks", True)
+        app.screenAdded.connect(_invalidate_screens)
+        app.screenRemoved.connect(_invalidate_screens)
+        app.primaryScreenChanged.connect(_invalidate_screens)
+    cache = []
+    for screen in QGuiApplication.screens():
+        if not screen.property("_popup_screen_hooks"):
+            screen.setProperty("_popup_screen_hooks", True)
+            screen.geometryChanged.connect(_invalidate_screens)
+            screen.availableGeometryChanged.connect(_invalidate_screens)
+        cache.append((_rect_bounds(screen.geometry()), _rect_bounds(screen.availableGeometry())))
+    primary = QGuiApplication.primaryScreen()
+    _primary_bounds = _rect_bounds(primary.availableGeometry()) if primary is not None else _FALLBACK_BOUNDS
+    _screen_cache = cache
+    return cache
+
+
+def _screen_bounds_at(x: int, y: int) -> tuple[int, int, int, int] | None:
+    cache = _screen_cache if _screen_cache is not None else _load_screens()
+    for (l, t, r, b), avail in cache:
+        if l <= x <= r and t <= y <= b:
+            return avail
+    return None
+
+
+def _available_bounds(x: int, y: int) -> tuple[int, int, int, int]:
+    return _screen_bounds_at(x, y) or _primary_bounds
+
+
+def _bounds_rect(bounds: tuple[int, int, int, int]) -> QRect:
+    l, t, r, b = bounds
+    return QRect(QPoint(l, t), QPoint(r, b))
+
+
 def _clamp_to_screen(pos: QPoint, size, margin: int = 8) -> QPoint:
-    screen = QGuiApplication.screenAt(pos)
-    if screen is None:
-        screen = QGuiApplication.primaryScreen()
-    geom = screen.availableGeometry() if screen is not None else QRect(0, 0, 1920, 1080)
-    x = max(geom.left() + margin, min(pos.x(), geom.right() - size.width() - margin))
-    y = max(geom.top() + margin, min(pos.y(), geom.bottom() - size.height() - margin))
+    left, top, right, bottom = _available_bounds(pos.x(), pos.y())
+    x = max(left + margin, min(pos.x(), right - size.width() - margin))
+    y = max(top + margin, min(pos.y(), bottom - size.height() - margin))
     return QPoint(x, y)
 
 
 class _ClickAwayFilter(QObject):
-    def __init__(self, widget: QWidget) -> None:
-        super().__init__(widget)
-        self._widget = widget
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._widgets: weakref.WeakSet[QWidget] = weakref.WeakSet()
+
+    def add(self, widget: QWidget) -> None:
+        self._widgets.add(widget)
+
+    def discard(self, widget: QWidget) -> None:
+        self._widgets.discard(widget)
 
     def eventFilter(self, obj, event):
-        if event.type() == QEvent.MouseButtonPress:
-            try:
+        if int(event.type()) != _MBP_INT or not self._widgets:
+            return False
+        gp = None
+        # One window() lookup per press instead of an ancestor walk per popup.
+        win = obj.window() if isinstance(obj, QWidget) else None
+        outside = None
+        for widget in self._widgets:
+            if win is widget:
+                continue
+            if gp is None:
+                # Only presses reach here, and those are always QMouseEvents.
                 gp = event.globalPosition().toPoint()
-            except Exception:
-                return False
-            if not self._widget.isVisible():
-                return False
-            if not self._widget.geometry().contains(gp):
-                self._widget.close()
+            if not widget.contains_global(gp):
+                if outside is None:
+                    outside = []
+                outside.append(widget)
+        if outside is not None:
+            # closeEvent discards from the set, so close only after iterating.
+            for widget in outside:
+                widget.close()
         return False
 
+
+_click_away: _ClickAwayFilter | None = None
+
+
+def _click_away_filter() -> _ClickAwayFilter | None:
+    global _click_away
+    if _click_away is None:
+        app = QGuiApplication.instance()
+        if app is None:
+            return None
+        _click_away = _ClickAwayFilter(app)
+        app.installEventFilter(_click_away)
+    return _click_away
+
+
 class _ImeAwareLineEdit(QLineEdit):
     submitted = Signal()
 
@@ -90,14 +204,21 @@ class _ImeAwareLineEdit(QLineEdit):
         return bool(self._composing)
 
     def inputMethodEvent(self, event) -> None:
-        try:
-            self._composing = bool(event.preeditString())
-        except Exception:
-            self._composing = False
+        self._composing = bool(event.preeditString())
+        committing = bool(event.commitString())
+        if self._composing and not committing:
+            # Preedit churn: keep textChanged quiet until the composition commits.
+            blocked = self.blockSignals(True)
+            try:
+                super().inputMethodEvent(event)
+            finally:
+                self.blockSignals(blocked)
+            return
         super().inputMethodEvent(event)
 
     def keyPressEvent(self, event) -> None:
-        if event.key() in (Qt.Key_Return, Qt.Key_Enter):
+        k = int(event.key())
+        if k == _K_RET or k == _K_ENT:
             if self._composing:
                 super().keyPressEvent(event)
                 return
@@ -117,14 +238,21 @@ class _ImeAwarePlainTextEdit(QPlainTextEdit):
         return bool(self._composing)
 
     def inputMethodEvent(self, event) -> None:
-        try:
-            self._composing = bool(event.preeditString())
-        except Exception:
-            self._composing = False
+        self._composing = bool(event.preeditString())
+        committing = bool(event.commitString())
+        if self._composing and not committing:
+            # Preedit churn: keep textChanged quiet until the composition commits.
+            blocked = self.blockSignals(True)
+            try:
+                super().inputMethodEvent(event)
+            finally:
+                self.blockSignals(blocked)
+            return
         super().inputMethodEvent(event)
 
     def keyPressEvent(self, event) -> None:
-        if event.key() in (Qt.Key_Return, Qt.Key_Enter):
+        k = int(event.key())
+        if k == _K_RET or k == _K_ENT:
             if self._composing:
                 super().keyPressEvent(event)
                 return
@@ -140,18 +268,41 @@ class FloatingPopup(QWidget):
     dismissed = Signal()
     f2_confirmed = Signal(str)
     f2_canceled_with_paste = Signal(str)
+    geometry_changed = Signal()
+    mode_changed = Signal(str)
 
     def __init__(self) -> None:
         super().__init__()
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
         self.setAttribute(Qt.WA_TranslucentBackground, True)
 
+        self._mode = "idle"
+        self._bounds = (0, 0, -1, -1)
+        self._enter_callback = None
+        self._typing_timer = QTimer(self)
+        self._typing_timer.setSingleShot(True)
+        self._typing_timer.timeout.connect(self._fire_typing_translate)
+        self._typing_deadline = 0.0
+        self._last_raw = ""
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(0)
+        self._resize_timer.timeout.connect(self.adjustSize)
+        self._last_sent = ""
+        self._auto_commit = False
+        self._shown_text: dict[QWidget, str] = {}
+        self._built = False
+
+    def _ensure_built(self) -> None:
+        if self._built:
+            return
+        self._built = True
+
         outer = QVBoxLayout(self)
         outer.setContentsMargins(0, 0, 0, 0)
         outer.setSpacing(0)
 
-        self._card = QWidget(self)
-        self._card.setObjectName("PopupCard")
+        self._card = _Card(self)
         outer.addWidget(self._card)
 
         layout = QVBoxLayout(self._card)
@@ -181,80 +332,97 @@ class FloatingPopup(QWidget):
         layout.addWidget(self.input_edit)
         layout.addWidget(self.source_view)
         layout.addWidget(self.target_view)
-        self.setStyleSheet(_QSS_POPUP)
-
-        self._mode = "idle"
-        self._enter_callback = None
-        self._click_filter: _ClickAwayFilter | None = None
-        self._typing_timer = QTimer(self)
-        self._typing_timer.setSingleShot(True)
-        self._typing_timer.timeout.connect(self._fire_typing_translate)
-        self._last_sent = ""
-        self._auto_commit = False
+        install_popup_styles(QGuiApplication.instance())
 
         self.input_edit.submitted.connect(self._on_enter)
         self.input_edit.textChanged.connect(self._on_text_changed)
 
+    def _set_mode(self, mode: str) -> None:
+        if mode != self._mode:
+            self._mode = mode
+            self.mode_changed.emit(mode)
+
+    def _set_shown(self, widget: QWidget, text: str) -> bool:
+        # Read-only views and the title only change through here, so skipping an
+        # identical string avoids a relayout of the document.
+        if self._shown_text.get(widget) == text:
+            return False
+        self._shown_text[widget] = text
+        if widget is self.title_label:
+            widget.setText(text)
+        else:
+            widget.setPlainText(text)
+        return True
+
     def open_f1(self, anchor: QPoint, source: str, translated: str) -> None:
-        self._mode = "F1"
+        self._ensure_built()
+        self._set_mode("F1")
         self.setAttribute(Qt.WA_ShowWithoutActivating, True)
-        self.title_label.setText("划词翻译")
+        self._set_shown(self.title_label, "划词翻译")
         self.input_edit.hide()
         self.source_view.show()
-        self.source_view.setPlainText((source or "").strip())
-        self.target_view.setPlainText((translated or "").strip() or "未获得翻译结果")
+        self._set_shown(self.source_view, (source or "").strip())
+        self._set_shown(self.target_view, (translated or "").strip() or "未获得翻译结果")
         self._show_at(anchor, activate=False)
 
     def open_f2(self, anchor: QPoint, enter_callback) -> None:
-        self._mode = "F2"
+        self._ensure_built()
+        self._set_mode("F2")
         self._enter_callback = enter_callback
         self.setAttribute(Qt.WA_ShowWithoutActivating, False)
-        self.title_label.setText("打字翻译")
+        self._set_shown(self.title_label, "打字翻译")
         self.input_edit.show()
         self.input_edit.setReadOnly(False)
+        self._last_raw = ""
         self.input_edit.clear()
         self._last_sent = ""
         self._auto_commit = False
         self.source_view.hide()
-        self.target_view.setPlainText("")
+        self._set_shown(self.target_view, "")
         self._show_at(anchor, activate=True)
         self.input_edit.setFocus()
 
     def show_f2_inline(self, anchor: QPoint, source: str, translated: str) -> None:
-        self._mode = "F2_INLINE"
+        self._ensure_built()
+        self._set_mode("F2_INLINE")
         self.setAttribute(Qt.WA_ShowWithoutActivating, True)
-        self.title_label.setText("打字翻译")
+        self._set_shown(self.title_label, "打字翻译")
         self.input_edit.hide()
         self.source_view.show()
-        self.source_view.setPlainText((source or "").strip())
-        self.target_view.setPlainText((translated or "").strip())
+        self._set_shown(self.source_view, (source or "").strip())
+        self._set_shown(self.target_view, (translated or "").strip())
         self._show_at(anchor, activate=False)
 
     def set_f2_translating(self) -> None:
         if self._mode != "F2":
             return
-        self.target_view.setPlainText("翻译中...")
-        self.adjustSize()
+        if self._set_shown(self.target_view, "翻译中..."):
+            self._schedule_adjust()
 
     def set_f2_result(self, translated: str) -> None:
         if self._mode != "F2":
             return
         result = (translated or "").strip() or "未获得翻译结果"
-        self.target_view.setPlainText(result)
-        self.adjustSize()
+        if self._set_shown(self.target_view, result):
+            self._schedule_adjust()
         self._auto_commit = False
 
     def show_error(self, anchor: QPoint, title: str, message: str) -> None:
-        self._mode = "ERR"
+        self._ensure_built()
+        self._set_mode("ERR")
         self.setAttribute(Qt.WA_ShowWithoutActivating, True)
-        self.title_label.setText(title or "错误")
+        self._set_shown(self.title_label, title or "错误")
         self.input_edit.hide()
         self.source_view.hide()
-        self.target_view.setPlainText(message or "")
+        self._set_shown(self.target_view, message or "")
         self._show_at(anchor, activate=False)
 
+    def _schedule_adjust(self) -> None:
+        if not self._resize_timer.isActive():
+            self._resize_timer.start()
+
     def keyPressEvent(self, event) -> None:
-        if event.key() == Qt.Key_Escape:
+        if int(event.key()) == _K_ESC:
             if self._mode == "F2":
                 self.f2_canceled_with_paste.emit(self.input_edit.toPlainText())
                 return
@@ -262,8 +430,29 @@ class FloatingPopup(QWidget):
             return
         super().keyPressEvent(event)
 
-    def closeEvent(self, event) -> None:
+    def moveEvent(self, event) -> None:
+        super().moveEvent(event)
+        self._bounds = _rect_bounds(self.geometry())
+        self.geometry_changed.emit()
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self._bounds = _rect_bounds(self.geometry())
+        self.geometry_changed.emit()
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self._bounds = _rect_bounds(self.geometry())
+        self._install_click_filter()
+        self.geometry_changed.emit()
+
+    def hideEvent(self, event) -> None:
+        super().hideEvent(event)
+        # The click-away filter only holds shown popups, so it never checks visibility.
         self._uninstall_click_filter()
+        self.geometry_changed.emit()
+
+    def closeEvent(self, event) -> None:
         self._typing_timer.stop()
         self.dismissed.emit()
         super().closeEvent(event)
@@ -284,18 +473,30 @@ class FloatingPopup(QWidget):
             return
         if self.input_edit.is_composing():
             return
-        self._typing_timer.start(260)
+        raw = self.input_edit.toPlainText()
+        if raw == self._last_raw:
+            return
+        self._last_raw = raw
+        # Push the deadline out instead of re-arming the timer on every keystroke.
+        self._typing_deadline = time.monotonic() + _TYPING_DEBOUNCE_S
+        if not self._typing_timer.isActive():
+            self._typing_timer.start(_TYPING_TICK_MS)
 
     def _fire_typing_translate(self, force: bool = False) -> None:
         if self._mode != "F2" or self._enter_callback is None:
             return
+        if not force:
+            remaining = self._typing_deadline - time.monotonic()
+            if remaining > 0:
+                self._typing_timer.start(max(1, min(_TYPING_TICK_MS, int(remaining * 1000) + 1)))
+                return
         if self.input_edit.is_composing():
             return
-        text = (self.input_edit.toPlainText() or "").strip()
+        text = self._last_raw.strip()
         if not text:
             self._last_sent = ""
-            self.target_view.setPlainText("")
-            self.adjustSize()
+            if self._set_shown(self.target_view, ""):
+                self._schedule_adjust()
             return
         if not force and text == self._last_sent:
             return
@@ -316,10 +517,9 @@ class FloatingPopup(QWidget):
         self.input_edit.setMaximumHeight(max_input_h)
 
     def _show_at(self, anchor: QPoint, activate: bool) -> None:
-        screen = QGuiApplication.screenAt(anchor)
-        if screen is None:
-            screen = QGuiApplication.primaryScreen()
-        geom = screen.availableGeometry() if screen is not None else QRect(0, 0, 1920, 1080)
+        was_visible = self.isVisible()
+        self.setUpdatesEnabled(False)
+        geom = _bounds_rect(_available_bounds(anchor.x(), anchor.y()))
         self._apply_size_constraints(geom)
         self.adjustSize()
 
@@ -332,46 +532,51 @@ class FloatingPopup(QWidget):
         y = y_below if (y_below + h) <= geom.bottom() else y_above
 
         self.move(_clamp_to_screen(QPoint(x, y), self.size()))
+        self.setUpdatesEnabled(True)
         self.show()
-        self.raise_()
-        if activate:
+        if not was_visible:
+            self.raise_()
+        if activate and not self.isActiveWindow():
             self.activateWindow()
-        self._install_click_filter()
+
+    def contains_global(self, pos: QPoint) -> bool:
+        left, top, right, bottom = self._bounds
+        return left <= pos.x() <= right and top <= pos.y() <= bottom
 
     def _install_click_filter(self) -> None:
-        if self._click_filter is not None:
-            return
-        app = QGuiApplication.instance()
-        if app is None:
-            return
-        self._click_filter = _ClickAwayFilter(self)
-        app.installEventFilter(self._click_filter)
+        f = _click_away_filter()
+        if f is not None:
+            f.add(self)
 
     def _uninstall_click_filter(self) -> None:
-        if self._click_filter is None:
-            return
-        app = QGuiApplication.instance()
-        if app is not None:
-            app.removeEventFilter(self._click_filter)
-        self._click_filter = None
+        if _click_away is not None:
+            _click_away.discard(self)
 
 
 
 class ScreenshotResultOverlay(QWidget):
     dismissed = Signal()
     extract_requested = Signal()
+    geometry_changed = Signal()
 
     def __init__(self) -> None:
         super().__init__()
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
         self.setAttribute(Qt.WA_TranslucentBackground, True)
 
+        self._bounds = (0, 0, -1, -1)
+        self._built = False
+
+    def _ensure_built(self) -> None:
+        if self._built:
+            return
+        self._built = True
+
         outer = QVBoxLayout(self)
         outer.setContentsMargins(0, 0, 0, 0)
         outer.setSpacing(0)
 
-        self._card = QWidget(self)
-        self._card.setObjectName("PopupCard")
+        self._card = _Card(self)
         outer.addWidget(self._card)
 
         layout = QVBoxLayout(self._card)
@@ -389,19 +594,19 @@ class ScreenshotResultOverlay(QWidget):
         self.extract_button.clicked.connect(self.extract_requested.emit)
         layout.addWidget(self.extract_button, 0, Qt.AlignRight)
 
-        self.setStyleSheet(_QSS_POPUP)
-        self._click_filter: _ClickAwayFilter | None = None
+        install_popup_styles(QGuiApplication.instance())
 
     def open_for_rect(self, rect: QRect, text: str) -> None:
+        self._ensure_built()
         self.text_view.setPlainText(text or "")
         self.extract_button.setEnabled(bool(text and text not in ("识别中...", "翻译中...")))
 
-        screen = QGuiApplication.screenAt(rect.center())
-        if screen is None:
-            screen = QGuiApplication.screenAt(QCursor.pos())
-        if screen is None:
-            screen = QGuiApplication.primaryScreen()
-        screen_geom = screen.availableGeometry() if screen is not None else QRect(0, 0, 1920, 1080)
+        c = rect.center()
+        bounds = _screen_bounds_at(c.x(), c.y())
+        if bounds is None:
+            c = QCursor.pos()
+            bounds = _available_bounds(c.x(), c.y())
+        screen_geom = _bounds_rect(bounds)
         self.text_view.setMaximumHeight(max(120, int(screen_geom.height() * 0.35)))
 
         self.adjustSize()
@@ -430,26 +635,41 @@ class ScreenshotResultOverlay(QWidget):
         self.show()
         self.raise_()
         self.activateWindow()
+
+    def moveEvent(self, event) -> None:
+        super().moveEvent(event)
+        self._bounds = _rect_bounds(self.geometry())
+        self.geometry_changed.emit()
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self._bounds = _rect_bounds(self.geometry())
+        self.geometry_changed.emit()
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self._bounds = _rect_bounds(self.geometry())
         self._install_click_filter()
+        self.geometry_changed.emit()
 
-    def closeEvent(self, event) -> None:
+    def hideEvent(self, event) -> None:
+        super().hideEvent(event)
         self._uninstall_click_filter()
+        self.geometry_changed.emit()
+
+    def closeEvent(self, event) -> None:
         self.dismissed.emit()
         super().closeEvent(event)
 
+    def contains_global(self, pos: QPoint) -> bool:
+        left, top, right, bottom = self._bounds
+        return left <= pos.x() <= right and top <= pos.y() <= bottom
+
     def _install_click_filter(self) -> None:
-        if self._click_filter is not None:
-            return
-        app = QGuiApplication.instance()
-        if app is None:
-            return
-        self._click_filter = _ClickAwayFilter(self)
-        app.installEventFilter(self._click_filter)
+        f = _click_away_filter()
+        if f is not None:
+            f.add(self)
 
     def _uninstall_click_filter(self) -> None:
-        if self._click_filter is None:
-            return
-        app = QGuiApplication.instance()
-        if app is not None:
-            app.removeEventFilter(self._click_filter)
-        self._click_filter = None
+        if _click_away is not None:
+            _click_away.discard(self)